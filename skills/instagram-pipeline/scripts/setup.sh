@@ -29,7 +29,7 @@ fi
 
 # Install the bundled socmed package in editable mode
 echo "Installing socmed package..."
-"$VENV_DIR/bin/pip" install --quiet -e "$SCRIPT_DIR"
+"$VENV_DIR/bin/pip" install --quiet -e "$SCRIPT_DIR[speedups]"
 
 # Install extraction dependencies if requested
 if [ "$1" = "--extract" ]; then
@@ -2,58 +2,94 @@
 
 When bundled as a skill, the data directory defaults to the current working
 directory (where the user runs the pipeline). Override with SOCMED_DATA_DIR
-environment variable for explicit control.
+environment variable for explicit control. Paths are resolved on first
+attribute access, not at import.
 """
 
+from __future__ import annotations
+
+import functools
 import os
 from pathlib import Path
 
-# Data directory: configurable for portability
-# Priority: SOCMED_DATA_DIR env var > auto-detect > current directory
-_auto_root = Path(__file__).resolve().parent.parent
-_has_data_dir = (_auto_root / "data").exists()
-
-PROJECT_ROOT = Path(
-    os.environ.get("SOCMED_DATA_DIR", str(_auto_root if _has_data_dir else Path.cwd()))
-)
-
-# Data directories
-DATA_DIR = PROJECT_ROOT / "data"
-CREDENTIALS_DIR = PROJECT_ROOT / "credentials"
-LEGACY_DIR = PROJECT_ROOT / "legacy"
-MEDIA_DIR = DATA_DIR / "media"
-
-# Per-platform data paths
-PLATFORM_DATA = {
-    "threads": DATA_DIR / "threads",
-    "linkedin": DATA_DIR / "linkedin",
-    "instagram": DATA_DIR / "instagram",
-}
 
-# Per-platform credential paths
-PLATFORM_CREDENTIALS = {
-    "instagram": CREDENTIALS_DIR / "instagram" / "session.json",
-    "linkedin": CREDENTIALS_DIR / "linkedin" / "cookies.json",
-    "threads": CREDENTIALS_DIR / "threads" / "account.json",
-}
+@functools.cache
+def _paths() -> dict:
+    """Resolve all data paths on first use.
+
+    Deferred so importing socmed doesn't touch the filesystem, and so
+    SOCMED_DATA_DIR can still be set after import (before first use).
+    """
+    # Data directory: configurable for portability
+    # Priority: SOCMED_DATA_DIR env var > auto-detect > current directory
+    _auto_root = Path(__file__).resolve().parent.parent
+    _has_data_dir = (_auto_root / "data").exists()
+
+    PROJECT_ROOT = Path(
+        os.environ.get("SOCMED_DATA_DIR", str(_auto_root if _has_data_dir else Path.cwd()))
+    )
+
+    # Data directories
+    DATA_DIR = PROJECT_ROOT / "data"
+    CREDENTIALS_DIR = PROJECT_ROOT / "credentials"
+    LEGACY_DIR = PROJECT_ROOT / "legacy"
+    MEDIA_DIR = DATA_DIR / "media"
+    CACHE_DIR = DATA_DIR / "cache"
+
+    # Per-platform data paths
+    PLATFORM_DATA = {
+        "threads": DATA_DIR / "threads",
+        "linkedin": DATA_DIR / "linkedin",
+        "instagram": DATA_DIR / "instagram",
+    }
+
+    # Per-platform credential paths
+    PLATFORM_CREDENTIALS = {
+        "instagram": CREDENTIALS_DIR / "instagram" / "session.json",
+        "linkedin": CREDENTIALS_DIR / "linkedin" / "cookies.json",
+        "threads": CREDENTIALS_DIR / "threads" / "account.json",
+    }
+
+    # Sync state file
+    SYNC_STATE_FILE = DATA_DIR / "sync_state.json"
+
+    # Data files per platform
+    DATA_FILES = {
+        "threads": {
+            "saved_posts": DATA_DIR / "threads" / "saved_posts.json",
+        },
+        "linkedin": {
+            "saved_posts": DATA_DIR / "linkedin" / "saved_posts.json",
+            "conversations": DATA_DIR / "linkedin" / "conversations.json",
+        },
+        "instagram": {
+            "saved_posts": DATA_DIR / "instagram" / "saved_posts.json",
+            "conversations": DATA_DIR / "instagram" / "conversations.json",
+            "collections_cache": DATA_DIR / "instagram" / "collections_cache.json",
+        },
+    }
+
+    return {
+        "PROJECT_ROOT": PROJECT_ROOT,
+        "DATA_DIR": DATA_DIR,
+        "CREDENTIALS_DIR": CREDENTIALS_DIR,
+        "LEGACY_DIR": LEGACY_DIR,
+        "MEDIA_DIR": MEDIA_DIR,
+        "CACHE_DIR": CACHE_DIR,
+        "PLATFORM_DATA": PLATFORM_DATA,
+        "PLATFORM_CREDENTIALS": PLATFORM_CREDENTIALS,
+        "SYNC_STATE_FILE": SYNC_STATE_FILE,
+        "DATA_FILES": DATA_FILES,
+    }
+
+
+def __getattr__(name: str):
+    # PEP 562: PROJECT_ROOT, DATA_DIR, DATA_FILES, ... resolve lazily
+    try:
+        return _paths()[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-# Sync state file
-SYNC_STATE_FILE = DATA_DIR / "sync_state.json"
-
-# Data files per platform
-DATA_FILES = {
-    "threads": {
-        "saved_posts": DATA_DIR / "threads" / "saved_posts.json",
-    },
-    "linkedin": {
-        "saved_posts": DATA_DIR / "linkedin" / "saved_posts.json",
-        "conversations": DATA_DIR / "linkedin" / "conversations.json",
-    },
-    "instagram": {
-        "saved_posts": DATA_DIR / "instagram" / "saved_posts.json",
-        "conversations": DATA_DIR / "instagram" / "conversations.json",
-    },
-}
 
 # Rate limiting defaults (requests per minute)
 RATE_LIMITS = {
@@ -76,9 +112,10 @@ CONTENT_TYPES = {
 
 def ensure_dirs() -> None:
     """Create all required directories if they don't exist."""
-    for d in [DATA_DIR, CREDENTIALS_DIR, LEGACY_DIR, MEDIA_DIR]:
-        d.mkdir(parents=True, exist_ok=True)
-    for platform_dir in PLATFORM_DATA.values():
+    paths = _paths()
+    for key in ("DATA_DIR", "CREDENTIALS_DIR", "LEGACY_DIR", "MEDIA_DIR"):
+        paths[key].mkdir(parents=True, exist_ok=True)
+    for platform_dir in paths["PLATFORM_DATA"].values():
         platform_dir.mkdir(parents=True, exist_ok=True)
-    for cred_path in PLATFORM_CREDENTIALS.values():
+    for cred_path in paths["PLATFORM_CREDENTIALS"].values():
         cred_path.parent.mkdir(parents=True, exist_ok=True)
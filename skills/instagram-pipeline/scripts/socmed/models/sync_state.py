@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncCursor:
     """Tracks sync progress for a specific platform + content_type combination.
 
@@ -50,8 +50,27 @@ class SyncCursor:
         self.error_message = error
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        """Serialize for the sync state file, including the derived key."""
+        return {
+            "key": self.key,
+            "platform": self.platform,
+            "content_type": self.content_type,
+            "last_id": self.last_id,
+            "last_timestamp": self.last_timestamp,
+            "total_items": self.total_items,
+            "last_sync_at": self.last_sync_at,
+            "last_sync_status": self.last_sync_status,
+            "error_message": self.error_message,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> SyncCursor:
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        try:
+            # Stored cursors (written by to_dict) carry every field
+            return cls(*[data[name] for name in _FIELDS])
+        except KeyError:
+            return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+# Field names in declaration (= positional argument) order
+_FIELDS = tuple(SyncCursor.__dataclass_fields__)
@@ -15,25 +15,34 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 import sys
+import tempfile
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
-import requests
-
-from socmed.config import DATA_FILES, MEDIA_DIR
+from socmed import config
 from socmed.platforms.instagram.browser_enricher import (
     _extract_media_from_item,
     build_session,
     download_post_media,
     get_chrome_cookies,
+    get_download_pool,
 )
 from socmed.storage.json_store import JsonStore
 from socmed.storage.sync_tracker import SyncTracker
+from socmed.utils import jsonio
+from socmed.utils.timefmt import utc_iso
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
@@ -41,53 +50,224 @@ logger = logging.getLogger(__name__)
 COLLECTIONS_URL = "https://www.instagram.com/api/v1/collections/list/"
 SAVED_FEED_URL = "https://www.instagram.com/api/v1/feed/saved/posts/"
 
+# Media downloads submitted to the pool at once during sync
+MAX_INFLIGHT_DOWNLOADS = 32
+
+# Collections change rarely — reuse the cached list for this long (seconds)
+COLLECTIONS_CACHE_MAX_AGE = 6 * 3600
+
+# Instagram media_type -> (our content_type, post URL template).
+# 1 = photo, 2 = video/reel, 8 = carousel; anything else is a plain post.
+_MEDIA_TYPES = {
+    2: ("reel", "https://www.instagram.com/reel/{}/"),
+}
+_DEFAULT_MEDIA_TYPE = ("saved_post", "https://www.instagram.com/p/{}/")
+
+# Progress lines redraw in place on a terminal; when piped to a log they are
+# printed as separate lines, every _LOG_PROGRESS_EVERY pages
+_IS_TTY = sys.stdout.isatty()
+_CR = "\r" if _IS_TTY else ""
+_LOG_PROGRESS_EVERY = 10
+
+# Cursor error message for a sync whose feed pagination was cut short
+_INCOMPLETE_FETCH = "feed pagination stopped early (request failed); run sync again"
+
+_SCALAR_EVENTS = frozenset({"null", "boolean", "integer", "double", "number", "string"})
+
+
+def _iter_page_items(resp: requests.Response, meta: dict) -> Iterator[dict]:
+    """Yield the 'items' of a paginated API response one at a time.
+
+    Top-level scalars (more_available, next_max_id, ...) are collected into
+    meta; it is complete once the generator is exhausted.
+
+    With ijson installed (the 'speedups' extra) the body is parsed
+    incrementally from the socket, so only one item is materialized at a
+    time. Otherwise the page is parsed whole. The response should be
+    requested with stream=True.
+    """
+    try:
+        import ijson
+    except ImportError:
+        data = jsonio.loads(resp.content)
+        meta.update((k, v) for k, v in data.items() if k != "items")
+        yield from data.get("items", [])
+        return
+
+    def events():
+        for prefix, event, value in ijson.parse(resp.raw, use_float=True):
+            if prefix and "." not in prefix and event in _SCALAR_EVENTS:
+                meta[prefix] = value
+            yield prefix, event, value
+
+    resp.raw.decode_content = True
+    yield from ijson.items(events(), "items.item")
 
-def fetch_collections(session: requests.Session) -> list[dict]:
+
+def _fetch_page(
+    session: requests.Session,
+    url: str,
+    params: dict,
+    delay: float,
+    stop: threading.Event,
+    headers: dict | None = None,
+) -> tuple[list[dict], dict] | None:
+    """Wait delay seconds, then fetch and parse one page of a paginated endpoint.
+
+    Returns (items, meta), or None on an HTTP error or if stop was set
+    during the wait. meta also carries the response ETag, and a 304 reply
+    to a conditional request yields ([], {"not_modified": True}).
+    """
+    if stop.wait(delay):
+        return None
+
+    resp = session.get(url, params=params, headers=headers, timeout=15, stream=True)
+    try:
+        if resp.status_code == 304:
+            return [], {"not_modified": True}
+        if resp.status_code != 200:
+            logger.error(f"{url} failed: {resp.status_code}")
+            return None
+        meta: dict = {"etag": resp.headers.get("ETag", "")}
+        items = list(_iter_page_items(resp, meta))
+        return items, meta
+    finally:
+        resp.close()
+
+
+def _iter_pages(
+    session: requests.Session,
+    url: str,
+    delay: float,
+    headers: dict | None = None,
+    first_meta: dict | None = None,
+    status: dict | None = None,
+) -> Iterator[list[dict]]:
+    """Yield the items of each page of a max_id-paginated endpoint.
+
+    The next page is fetched on a background thread (after the rate-limit
+    delay) while the caller processes the current one. Closing the
+    generator early abandons any pending prefetch.
+
+    headers are sent with the first request only (e.g. If-None-Match);
+    that request's meta is copied into first_meta if given. status, if
+    given, gets "complete" set to True when the last page has been
+    yielded — a failed request (429, 5xx, expired session) also ends
+    iteration, but leaves it unset.
+    """
+    stop = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(_fetch_page, session, url, {}, 0, stop, headers)
+    try:
+        while future is not None:
+            page = future.result()
+            if page is None:
+                return
+            items, meta = page
+            if first_meta is not None:
+                first_meta.update(meta)
+                first_meta = None
+
+            future = None
+            max_id = meta.get("next_max_id")
+            if meta.get("more_available") and max_id:
+                future = pool.submit(_fetch_page, session, url, {"max_id": max_id}, delay, stop)
+            elif status is not None:
+                status["complete"] = True
+            yield items
+    finally:
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_collections(
+    session: requests.Session,
+    etag: str | None = None,
+    meta: dict | None = None,
+) -> list[dict]:
     """Fetch all saved collections with names and IDs.
 
     Returns list of dicts with: id, name, count.
     Paginates automatically if more_available.
+
+    If etag is given the first page is requested conditionally. Pass a
+    meta dict to learn the outcome: it receives the new "etag", or
+    "not_modified" when the server answered 304 (the result is then empty).
     """
-    collections = []
-    max_id = None
+    headers = {"If-None-Match": etag} if etag else None
+    return [
+        {
+            "id": str(item.get("collection_id", "")),
+            "name": item.get("collection_name", ""),
+            "count": item.get("collection_media_count", 0),
+        }
+        for items in _iter_pages(session, COLLECTIONS_URL, delay=1, headers=headers, first_meta=meta)
+        for item in items
+    ]
 
-    while True:
-        params = {}
-        if max_id:
-            params["max_id"] = max_id
 
-        resp = session.get(COLLECTIONS_URL, params=params, timeout=15)
-        if resp.status_code != 200:
-            logger.error(f"Collections list failed: {resp.status_code}")
-            break
-
-        data = resp.json()
-        for item in data.get("items", []):
-            collections.append({
-                "id": str(item.get("collection_id", "")),
-                "name": item.get("collection_name", ""),
-                "count": item.get("collection_media_count", 0),
-            })
-
-        if not data.get("more_available"):
-            break
-        max_id = data.get("next_max_id")
-        time.sleep(1)
+def _write_collections_cache(path: Path, cache: dict) -> None:
+    """Atomically write the collections cache file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp", prefix=".collections_")
+    try:
+        with open(fd, "wb") as f:
+            f.write(jsonio.dumps(cache, indent=True))
+        os.replace(tmp_path, path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
 
-    return collections
 
+def _load_collections_cached(
+    session: requests.Session,
+    max_age: float = COLLECTIONS_CACHE_MAX_AGE,
+) -> list[dict]:
+    """Return saved collections, served from an on-disk cache while fresh.
 
-def _media_type_to_content_type(media_type: int) -> str:
-    """Map Instagram media_type int to our content_type string."""
-    # 1 = photo, 2 = video/reel, 8 = carousel
-    if media_type == 2:
-        return "reel"
-    return "saved_post"
+    Collection names and IDs rarely change, so the list is cached for
+    max_age seconds (pass 0 to force a refetch). Refetches are conditional
+    on the cached ETag, so an unchanged list costs a single 304. If
+    refetching fails, the stale cache is returned instead so commands keep
+    working offline.
+    """
+    cache_path = config.DATA_FILES["instagram"]["collections_cache"]
+    try:
+        cache = jsonio.loads(cache_path.read_bytes())
+        age = time.time() - cache_path.stat().st_mtime
+    except (FileNotFoundError, ValueError):
+        cache, age = None, None
+
+    if cache is not None and age < max_age:
+        return cache["collections"]
+
+    meta: dict = {}
+    try:
+        collections = fetch_collections(session, etag=cache and cache.get("etag"), meta=meta)
+    except Exception as e:
+        if cache is None:
+            raise
+        logger.warning(f"Collections fetch failed ({e}), using cache from {age / 3600:.1f}h ago")
+        return cache["collections"]
+
+    if meta.get("not_modified"):
+        cache_path.touch()
+        return cache["collections"]
+
+    if not collections:
+        if cache is not None:
+            logger.warning(f"Collections fetch returned nothing, using cache from {age / 3600:.1f}h ago")
+            return cache["collections"]
+        return collections
+
+    _write_collections_cache(cache_path, {"collections": collections, "etag": meta.get("etag", "")})
+    return collections
 
 
 def _api_item_to_post(
     item: dict,
     collection_map: dict[str, str],
+    now_iso: str | None = None,
 ) -> dict:
     """Convert an API saved feed item to our unified post format.
 
@@ -98,6 +278,8 @@ def _api_item_to_post(
     Args:
         item: Raw API item (has 'media' key).
         collection_map: Maps collection ID -> collection name.
+        now_iso: Timestamp for saved_at/harvested_at. Pass one shared value
+            when converting a batch; defaults to the current time.
 
     Returns:
         Post dict matching our saved_posts.json schema.
@@ -118,9 +300,8 @@ def _api_item_to_post(
     if caption_obj and isinstance(caption_obj, dict):
         caption_text = caption_obj.get("text", "")
 
-    # Content type from media_type
-    media_type_int = media.get("media_type", 1)
-    content_type = _media_type_to_content_type(media_type_int)
+    # Content type and post URL from media_type
+    content_type, post_url_fmt = _MEDIA_TYPES.get(media.get("media_type", 1), _DEFAULT_MEDIA_TYPE)
 
     # Extract media URLs using shared helper
     media_items = _extract_media_from_item(media)
@@ -140,7 +321,7 @@ def _api_item_to_post(
     created_at = ""
     taken_at = media.get("taken_at", 0)
     if taken_at:
-        created_at = datetime.fromtimestamp(taken_at, tz=timezone.utc).isoformat()
+        created_at = utc_iso(taken_at)
 
     # Collection membership
     collection_ids = media.get("saved_collection_ids", [])
@@ -150,10 +331,8 @@ def _api_item_to_post(
         if name:
             collections.append(name)
 
-    # Post URL
-    post_url = f"https://www.instagram.com/p/{shortcode}/"
-    if content_type == "reel":
-        post_url = f"https://www.instagram.com/reel/{shortcode}/"
+    if now_iso is None:
+        now_iso = datetime.now(tz=timezone.utc).isoformat()
 
     return {
         "id": shortcode,
@@ -167,10 +346,10 @@ def _api_item_to_post(
             "headline": "",
         },
         "media": media_list,
-        "post_url": post_url,
+        "post_url": post_url_fmt.format(shortcode),
         "created_at": created_at,
-        "saved_at": datetime.now(tz=timezone.utc).isoformat(),
-        "harvested_at": datetime.now(tz=timezone.utc).isoformat(),
+        "saved_at": now_iso,
+        "harvested_at": now_iso,
         "like_count": media.get("like_count", 0),
         "reply_count": media.get("comment_count", 0),
         "repost_count": 0,
@@ -186,62 +365,102 @@ def fetch_saved_posts(
     limit: int | None = None,
     delay: float = 2.0,
     collection_filter: str | None = None,
+    stop_at_pk: str | None = None,
+    known_ids: set[str] | None = None,
+    meta: dict | None = None,
 ) -> list[dict]:
     """Paginate through the saved posts feed and convert to post dicts.
 
+    The feed is ordered by save time (newest first), so once we reach the
+    post that topped the feed on the previous full sync, everything after
+    it is already in the store and pagination can stop.
+
     Args:
         session: Authenticated Instagram session.
         collection_map: Maps collection ID -> name (from fetch_collections).
-        limit: Max posts to fetch (None = all).
+        limit: Max posts to return (None = all).
         delay: Seconds between page requests.
         collection_filter: Only include posts in this collection (substring match).
+        stop_at_pk: Media PK of the newest post from the last full sync.
+            Pagination stops when this post is reached.
+        known_ids: Shortcodes already in the store. These are skipped
+            before conversion and don't count towards limit.
+        meta: Optional dict that receives "head" (the first post in the
+            feed, converted even if known), "known" (number skipped
+            via known_ids) and "complete" (False if a failed request cut
+            pagination short before the end of the feed, stop_at_pk or
+            limit).
 
     Returns:
         List of post dicts in saved_posts.json format.
     """
     posts = []
-    max_id = None
+    known = 0
+    if meta is None:
+        meta = {}
+    if known_ids is None:
+        known_ids = set()
+    now_iso = datetime.now(tz=timezone.utc).isoformat()
+
+    # Resolve the substring filter to matching collection IDs once, so
+    # non-matching items are skipped before they are converted
+    if collection_filter:
+        filter_lc = collection_filter.lower()
+        matching_cids = {cid for cid, name in collection_map.items() if filter_lc in name.lower()}
+    status: dict = {}
+    pages = _iter_pages(session, SAVED_FEED_URL, delay, status=status)
+    meta["complete"] = False
     page = 0
-
-    while True:
-        params = {}
-        if max_id:
-            params["max_id"] = max_id
-
-        resp = session.get(SAVED_FEED_URL, params=params, timeout=15)
-        if resp.status_code != 200:
-            logger.error(f"Saved feed failed: {resp.status_code}")
-            break
-
-        data = resp.json()
-        items = data.get("items", [])
-        page += 1
-
-        for item in items:
-            post = _api_item_to_post(item, collection_map)
-            if not post:
-                continue
-
-            # Apply collection filter
-            if collection_filter:
-                post_cols = post.get("collections", [])
-                if not any(collection_filter.lower() in c.lower() for c in post_cols):
+    last_progress = 0.0
+
+    try:
+        for page, items in enumerate(pages, 1):
+            for item in items:
+                media = item.get("media", item)
+                if stop_at_pk and str(media.get("pk", "")) == stop_at_pk:
+                    print(f"{_CR}  Reached last synced post after {page} pages")
+                    meta["complete"] = True
+                    return posts
+
+                if "head" not in meta:
+                    meta["head"] = _api_item_to_post(item, collection_map, now_iso)
+
+                # Apply collection filter
+                if collection_filter and not any(
+                    str(cid) in matching_cids for cid in media.get("saved_collection_ids") or ()
+                ):
                     continue
 
-            posts.append(post)
-
-            if limit and len(posts) >= limit:
-                return posts
-
-        sys.stdout.write(f"\r  Fetched {len(posts)} posts ({page} pages)...")
-        sys.stdout.flush()
+                if media.get("code") in known_ids:
+                    known += 1
+                    continue
 
-        if not data.get("more_available"):
-            break
-        max_id = data.get("next_max_id")
-        time.sleep(delay)
+                post = _api_item_to_post(item, collection_map, now_iso)
+                if not post:
+                    continue
 
-    print()  # Newline after progress
+                posts.append(post)
+
+                if limit and len(posts) >= limit:
+                    meta["complete"] = True
+                    return posts
+
+            # Throttled: at most once a second on a terminal
+            now = time.monotonic()
+            if (now - last_progress >= 1.0) if _IS_TTY else (page % _LOG_PROGRESS_EVERY == 0):
+                sys.stdout.write(f"{_CR}  Fetched {len(posts)} new posts, {known} already in store ({page} pages)...")
+                if not _IS_TTY:
+                    sys.stdout.write("\n")
+                sys.stdout.flush()
+                last_progress = now
+    finally:
+        pages.close()
+        meta["known"] = known
+
+    meta["complete"] = status.get("complete", False)
+    if not meta["complete"]:
+        print(f"{_CR}  Feed pagination stopped early after {page} pages (request failed)")
+    print(f"{_CR}  Fetched {len(posts)} new posts, {known} already in store ({page} pages)")
     return posts
 
 
@@ -251,21 +470,26 @@ def run_sync(
     download_media: bool = True,
     collection_filter: str | None = None,
     save_every: int = 100,
+    full: bool = False,
 ):
     """Sync saved posts from Instagram API into saved_posts.json.
 
-    Fetches all saved posts via the API, maps collection IDs to names,
+    Fetches saved posts via the API, maps collection IDs to names,
     and merges into the existing data store. Posts arrive pre-enriched
     so they're immediately ready for extraction.
 
     New posts are appended; existing posts are skipped (by shortcode).
+    Pagination stops at the newest post seen by the previous full sync
+    (tracked in the sync cursor), so steady-state runs only fetch the
+    pages containing newly saved posts.
 
     Args:
         limit: Max posts to fetch (None = all).
         delay: Seconds between API requests.
         download_media: Download media files alongside metadata.
         collection_filter: Only sync posts in this collection (substring match).
-        save_every: Save progress every N posts.
+        save_every: Append finished posts to the store every N posts.
+        full: Ignore the sync cursor and paginate the whole saved feed.
     """
     print("Loading Chrome cookies...")
     cookies = get_chrome_cookies()
@@ -275,7 +499,7 @@ def run_sync(
 
     # Step 1: Fetch collections for ID -> name mapping
     print("\nFetching collections...")
-    collections = fetch_collections(session)
+    collections = _load_collections_cached(session)
     if not collections:
         print("No collections found. Make sure you're logged into Instagram in Chrome.")
         sys.exit(1)
@@ -284,135 +508,220 @@ def run_sync(
     total_saved = sum(c["count"] for c in collections)
 
     print(f"Found {len(collections)} collections ({total_saved} total posts):")
+    filter_lc = collection_filter.lower() if collection_filter else None
     for c in collections:
         marker = ""
-        if collection_filter and collection_filter.lower() in c["name"].lower():
+        if filter_lc and filter_lc in c["name"].lower():
             marker = " <-- target"
         print(f"  {c['name']}: {c['count']} posts{marker}")
 
     # Step 2: Load existing posts to skip duplicates
-    store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
-    existing = store.read()
-    existing_ids = {p["id"] for p in existing}
+    store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
+    existing_ids = store.read_ids()
     print(f"\nExisting posts in store: {len(existing_ids)}")
 
+    # Only an unfiltered, unlimited run sees the whole head of the feed, so
+    # only such a run may move the cursor. Any run may stop at it, though.
+    tracker = SyncTracker()
+    cursor = tracker.get("instagram", "saved")
+    stop_at_pk = None if full else (cursor.last_id or None)
+    advances_cursor = not limit and not collection_filter
+
     # Step 3: Fetch saved posts from API
     col_str = f" in \"{collection_filter}\"" if collection_filter else ""
     limit_str = f" (limit: {limit})" if limit else ""
-    print(f"\nFetching saved posts{col_str}{limit_str}...")
+    since_str = f" (new since {cursor.last_sync_at[:10]})" if stop_at_pk and cursor.last_sync_at else ""
+    print(f"\nFetching saved posts{col_str}{limit_str}{since_str}...")
 
-    api_posts = fetch_saved_posts(
+    # Posts already in the store are skipped inside the fetch, before conversion
+    feed_meta: dict = {}
+    new_posts = fetch_saved_posts(
         session=session,
         collection_map=collection_map,
         limit=limit,
         delay=delay,
         collection_filter=collection_filter,
+        stop_at_pk=stop_at_pk,
+        known_ids=existing_ids,
+        meta=feed_meta,
     )
+    skipped = feed_meta.get("known", 0)
+    fetched = len(new_posts) + skipped
 
-    if not api_posts:
+    if not fetched:
         print("No posts fetched.")
         return
 
-    # Step 4: Filter out duplicates
-    new_posts = [p for p in api_posts if p["id"] not in existing_ids]
-    skipped = len(api_posts) - len(new_posts)
-    print(f"Fetched {len(api_posts)} posts ({len(new_posts)} new, {skipped} already in store)")
+    print(f"Fetched {fetched} posts ({len(new_posts)} new, {skipped} already in store)")
+
+    # The newest post in the feed becomes the cursor (empty dict = keep
+    # cursor). A fetch cut short by a failed request must not move it: the
+    # next incremental run would stop at the head and never fetch the posts
+    # below the point where this one gave up.
+    complete = feed_meta.get("complete", False)
+    head = (feed_meta.get("head") or {}) if advances_cursor and complete else {}
 
     if not new_posts:
         print("All posts already in store. Nothing to do.")
+        if head:
+            cursor.mark_success(
+                total_items=len(existing_ids),
+                last_id=head.get("media_pk", ""),
+                last_timestamp=head.get("created_at", ""),
+            )
+        elif not complete:
+            cursor.mark_partial(total_items=len(existing_ids), error=_INCOMPLETE_FETCH)
+        if head or not complete:
+            tracker.save(cursor)
+            tracker.flush()
         return
 
-    # Step 5: Download media for new posts
+    # Posts are appended in batches of save_every as they become ready, so an
+    # interrupted sync keeps what it has finished. The cursor only moves
+    # past them once the whole sync succeeds.
+    added = 0
+    batch: list[dict] = []
+
+    def flush() -> None:
+        nonlocal added
+        if not batch:
+            return
+        added += store.append(batch)
+        batch.clear()
+        cursor.mark_partial(total_items=len(existing_ids) + added)
+        tracker.save(cursor)
+
+    # Step 4: Download media for new posts
     if download_media and new_posts:
         print(f"\nDownloading media for {len(new_posts)} new posts...")
-        executor = ThreadPoolExecutor(max_workers=4)
-        futures = []
+        to_download = [p for p in new_posts if p.get("media")]
+        batch.extend(p for p in new_posts if not p.get("media"))
+        queued = iter(to_download)
+        pending: dict[Future, dict] = {}
+        done = 0
         media_downloaded = 0
         media_bytes = 0
 
-        for post in new_posts:
-            if post.get("media"):
-                future = executor.submit(
-                    download_post_media,
-                    shortcode=post["id"],
-                    username=post.get("author", {}).get("username", "unknown"),
-                    media_list=[
-                        {"url": m["url"], "type": m["media_type"],
-                         "w": m.get("width", 0), "h": m.get("height", 0)}
-                        for m in post["media"] if m.get("url")
-                    ],
-                )
-                futures.append((future, post))
-
-        for i, (future, post) in enumerate(futures):
-            try:
-                updated_media = future.result(timeout=120)
-                post["media"] = [
-                    {
-                        "url": m.get("url", ""),
-                        "media_type": m.get("type", "image"),
-                        "local_path": m.get("local_path", ""),
-                        "alt_text": "",
-                        "width": m.get("w", 0),
-                        "height": m.get("h", 0),
-                    }
-                    for m in updated_media
-                ]
-                for m in updated_media:
-                    if m.get("local_path"):
-                        lp = Path(m["local_path"])
-                        if lp.exists():
-                            media_downloaded += 1
-                            media_bytes += lp.stat().st_size
-            except Exception as e:
-                logger.warning(f"Media download failed for {post['id']}: {e}")
-
-            if (i + 1) % 50 == 0 or i == len(futures) - 1:
-                mb = media_bytes / (1024 * 1024)
-                print(f"  [{i+1}/{len(futures)}] {media_downloaded} files ({mb:.0f}MB)")
-
-        executor.shutdown(wait=True)
+        def submit_next() -> None:
+            post = next(queued, None)
+            if post is None:
+                return
+            future = executor.submit(
+                download_post_media,
+                shortcode=post["id"],
+                username=post.get("author", {}).get("username", "unknown"),
+                media_list=[
+                    {"url": m["url"], "type": m["media_type"],
+                     "w": m.get("width", 0), "h": m.get("height", 0)}
+                    for m in post["media"] if m.get("url")
+                ],
+            )
+            pending[future] = post
+
+        # Keep a bounded window of downloads in flight and handle them in
+        # completion order, so one slow post doesn't hold up the rest
+        executor = get_download_pool()
+        try:
+            for _ in range(MAX_INFLIGHT_DOWNLOADS):
+                submit_next()
+
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    post = pending.pop(future)
+                    submit_next()
+                    done += 1
+                    try:
+                        updated_media = future.result()
+                        post["media"] = [
+                            {
+                                "url": m.get("url", ""),
+                                "media_type": m.get("type", "image"),
+                                "local_path": m.get("local_path", ""),
+                                "alt_text": "",
+                                "width": m.get("w", 0),
+                                "height": m.get("h", 0),
+                            }
+                            for m in updated_media
+                        ]
+                        for m in updated_media:
+                            if m.get("local_path"):
+                                lp = Path(m["local_path"])
+                                if lp.exists():
+                                    media_downloaded += 1
+                                    media_bytes += lp.stat().st_size
+                    except Exception as e:
+                        logger.warning(f"Media download failed for {post['id']}: {e}")
+
+                    batch.append(post)
+                    if len(batch) >= save_every:
+                        flush()
+
+                    if done % 50 == 0 or done == len(to_download):
+                        mb = media_bytes / (1024 * 1024)
+                        print(f"  [{done}/{len(to_download)}] {media_downloaded} files ({mb:.0f}MB)")
+        finally:
+            # On Ctrl-C, drop queued downloads instead of draining the window,
+            # but keep the posts whose downloads already finished. The pool
+            # itself is shared, so it stays up.
+            for future in pending:
+                future.cancel()
+            wait(pending)
+            flush()
         mb = media_bytes / (1024 * 1024)
         print(f"  Media: {media_downloaded} files ({mb:.1f} MB)")
-
-    # Step 6: Append to store
-    added = store.append(new_posts)
-    print(f"\nAdded {added} new posts to store (total: {store.count()})")
-
-    # Update sync tracker
-    tracker = SyncTracker()
-    cursor = tracker.get("instagram", "saved")
-    cursor.mark_success(total_items=store.count())
-    tracker.save(cursor)
+    else:
+        batch.extend(new_posts)
+
+    # Step 5: Append the rest to store and advance the cursor. The final
+    # write runs in the background while the collection breakdown prints.
+    def finish() -> int:
+        flush()
+        total = len(existing_ids) + added
+        if complete:
+            cursor.mark_success(
+                total_items=total,
+                last_id=head.get("media_pk", ""),
+                last_timestamp=head.get("created_at", ""),
+            )
+        else:
+            cursor.mark_partial(total_items=total, error=_INCOMPLETE_FETCH)
+        tracker.save(cursor)
+        # Cursor saves along the way skip fsync; make them durable once
+        tracker.flush()
+        return total
+
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        finished = writer.submit(finish)
+
+        # Show collection breakdown of new posts
+        col_counter = Counter(chain.from_iterable(p.get("collections", ()) for p in new_posts))
+        if col_counter:
+            print(f"\n  New posts by collection:")
+            for name, count in col_counter.most_common(10):
+                print(f"    {name}: {count}")
+
+        total = finished.result()
+
+    print(f"\nAdded {added} new posts to store (total: {total})")
 
     # Summary
     print(f"\n{'='*50}")
-    print(f"Sync complete")
-    print(f"  Fetched:  {len(api_posts)}")
+    print("Sync complete" if complete else "Sync incomplete (feed request failed) — run again")
+    print(f"  Fetched:  {fetched}")
     print(f"  New:      {len(new_posts)}")
     print(f"  Skipped:  {skipped} (already existed)")
-    print(f"  Total:    {store.count()}")
+    print(f"  Total:    {total}")
     if download_media:
         print(f"  Media:    {media_downloaded} files")
 
-    # Show collection breakdown of new posts
-    from collections import Counter
-    col_counter = Counter()
-    for p in new_posts:
-        for c in p.get("collections", []):
-            col_counter[c] += 1
-    if col_counter:
-        print(f"\n  New posts by collection:")
-        for name, count in col_counter.most_common(10):
-            print(f"    {name}: {count}")
-
 
-def show_collections():
-    """List all saved collections from the API."""
+def show_collections(refresh: bool = False):
+    """List all saved collections from the API (cached for a few hours)."""
     cookies = get_chrome_cookies()
     session = build_session(cookies)
 
-    collections = fetch_collections(session)
+    collections = _load_collections_cached(session, max_age=0 if refresh else COLLECTIONS_CACHE_MAX_AGE)
     if not collections:
         print("No collections found.")
         return
@@ -423,25 +732,22 @@ def show_collections():
         print(f"  {c['name']}: {c['count']} posts (id={c['id']})")
 
 
-def show_stats():
+def show_stats(refresh: bool = False):
     """Show sync status comparing API collections vs local store."""
     print("Loading Chrome cookies...")
     cookies = get_chrome_cookies()
     session = build_session(cookies)
 
     print("Fetching collections from API...")
-    collections = fetch_collections(session)
+    collections = _load_collections_cached(session, max_age=0 if refresh else COLLECTIONS_CACHE_MAX_AGE)
     collection_map = {c["id"]: c["name"] for c in collections}
 
-    store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
+    store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
+    store.compact()  # Refresh the saved_posts.json snapshot
     posts = store.read()
 
     # Count local posts per collection
-    from collections import Counter
-    local_counter = Counter()
-    for p in posts:
-        for c in p.get("collections", []):
-            local_counter[c] += 1
+    local_counter = Counter(chain.from_iterable(p.get("collections", ()) for p in posts))
 
     print(f"\n{'Collection':<35} {'API':>6} {'Local':>6} {'Delta':>6}")
     print("-" * 60)
@@ -487,9 +793,15 @@ def main():
                              help="Only sync posts in this collection (substring match)")
     sync_parser.add_argument("--save-every", type=int, default=100,
                              help="Save progress every N posts (default: 100)")
+    sync_parser.add_argument("--full", action="store_true",
+                             help="Paginate the whole saved feed, ignoring the sync cursor")
 
-    sub.add_parser("collections", help="List saved collections from API")
-    sub.add_parser("stats", help="Compare API collections vs local store")
+    collections_parser = sub.add_parser("collections", help="List saved collections from API")
+    collections_parser.add_argument("--refresh", action="store_true",
+                                    help="Bypass the collections cache")
+    stats_parser = sub.add_parser("stats", help="Compare API collections vs local store")
+    stats_parser.add_argument("--refresh", action="store_true",
+                              help="Bypass the collections cache")
 
     args = parser.parse_args()
 
@@ -500,11 +812,12 @@ def main():
             download_media=not args.no_media,
             collection_filter=args.collection,
             save_every=args.save_every,
+            full=args.full,
         )
     elif args.command == "collections":
-        show_collections()
+        show_collections(refresh=args.refresh)
     elif args.command == "stats":
-        show_stats()
+        show_stats(refresh=args.refresh)
     else:
         parser.print_help()
 
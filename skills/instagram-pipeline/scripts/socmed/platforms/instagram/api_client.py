@@ -11,13 +11,13 @@ Setup:
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import Optional
 
-from socmed.config import PLATFORM_CREDENTIALS
-from socmed.utils.retry import retry
+from socmed import config
+from socmed.utils import jsonio
+from socmed.utils.retry import retry, retry_after_delay
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +51,7 @@ class InstagramClient:
 
     def __init__(self):
         self._api = None
-        self._session_path = PLATFORM_CREDENTIALS["instagram"]
+        self._session_path = config.PLATFORM_CREDENTIALS["instagram"]
         self._logged_in = False
 
     def _ensure_api(self):
@@ -85,7 +85,7 @@ class InstagramClient:
 
         self._ensure_api()
         try:
-            session_data = json.loads(self._session_path.read_text())
+            session_data = jsonio.loads(self._session_path.read_bytes())
             self._api.set_settings(session_data)
             self._api.login_by_sessionid(session_data.get("authorization_data", {}).get("sessionid", ""))
             self._logged_in = True
@@ -99,7 +99,7 @@ class InstagramClient:
         """Save current session to file."""
         self._session_path.parent.mkdir(parents=True, exist_ok=True)
         settings = self._api.get_settings()
-        self._session_path.write_text(json.dumps(settings, indent=2))
+        self._session_path.write_bytes(jsonio.dumps(settings, indent=True))
         logger.info(f"Session saved to {self._session_path}")
 
     def test_connection(self) -> bool:
@@ -122,47 +122,47 @@ class InstagramClient:
             self.load_session()
         return self._api
 
-    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,))
+    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,), extract_delay=retry_after_delay)
     def get_saved_posts(self, amount: int = 50) -> list:
         """Fetch saved/bookmarked posts."""
         return self.api.collection_medias_by_name("All Posts", amount=amount)
 
-    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,))
+    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,), extract_delay=retry_after_delay)
     def get_collections(self) -> list:
         """Fetch all saved collections."""
         return self.api.collections()
 
-    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,))
+    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,), extract_delay=retry_after_delay)
     def get_collection_medias(self, collection_id: str, amount: int = 50) -> list:
         """Fetch media from a specific collection."""
         return self.api.collection_medias(collection_id, amount=amount)
 
-    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,))
+    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,), extract_delay=retry_after_delay)
     def get_direct_threads(self, amount: int = 20) -> list:
         """Fetch recent DM threads."""
         return self.api.direct_threads(amount=amount)
 
-    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,))
+    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,), extract_delay=retry_after_delay)
     def get_direct_messages(self, thread_id: str, amount: int = 50) -> list:
         """Fetch messages from a specific DM thread."""
         return self.api.direct_messages(thread_id, amount=amount)
 
-    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,))
+    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,), extract_delay=retry_after_delay)
     def send_direct_message(self, user_ids: list[int], text: str):
         """Send a DM to one or more users."""
         return self.api.direct_send(text, user_ids=user_ids)
 
-    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,))
+    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,), extract_delay=retry_after_delay)
     def like_media(self, media_id: str) -> bool:
         """Like a post."""
         return self.api.media_like(media_id)
 
-    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,))
+    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,), extract_delay=retry_after_delay)
     def comment_media(self, media_id: str, text: str):
         """Comment on a post."""
         return self.api.media_comment(media_id, text)
 
-    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,))
+    @retry(max_attempts=3, base_delay=3.0, exceptions=(Exception,), extract_delay=retry_after_delay)
     def follow_user(self, user_id: str) -> bool:
         """Follow a user."""
         return self.api.user_follow(user_id)
@@ -17,21 +17,33 @@ Usage:
 
 from __future__ import annotations
 
+import base64
 import hashlib
-import json
 import logging
+import os
+import random
+import re
+import shutil
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timezone
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-import requests
-
-from socmed.config import DATA_FILES, MEDIA_DIR
+from socmed import config
+from socmed.storage.file_cache import FileCache
 from socmed.storage.json_store import JsonStore
 from socmed.storage.sync_tracker import SyncTracker
+from socmed.utils import RateLimiter, jsonio
+from socmed.utils.retry import parse_retry_after
+from socmed.utils.timefmt import utc_iso
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
@@ -43,16 +55,63 @@ IG_APP_ID = "936619743392459"
 # REST API endpoint (fallback when GraphQL is checkpointed)
 REST_MEDIA_URL = "https://www.instagram.com/api/v1/media/{pk}/info/"
 
-# Base64 alphabet used by Instagram for shortcode <-> PK conversion
-_IG_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+# Connection pool size per host — comfortably above the number of worker
+# threads sharing a session, so connections are reused instead of churned
+POOL_MAXSIZE = 32
+
+# Read size when streaming media to disk. 1 MiB keeps syscalls per MP4 low
+# while bounding memory to one chunk per download worker.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Instagram shortcodes encode the PK in the URL-safe base64 alphabet
+# (A-Z a-z 0-9 - _), so they decode with the C codec
+_SHORTCODE_RE = re.compile(r"[A-Za-z0-9_-]*")
+
+# Body of a login/checkpoint page instead of an API response
+_HTML_START_RE = re.compile(rb"\s*<")
+
+# File extensions _guess_ext() accepts from a URL path
+_MEDIA_EXTS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp4", ".mov", ".webm"})
+
+
+# On 429 without Retry-After: initial backoff in seconds, doubled on each
+# consecutive 429 (with jitter so parallel runs don't retry in lockstep)
+RATE_LIMIT_BACKOFF = 60
 
+# Upper bound for that backoff (15 min)
+RATE_LIMIT_BACKOFF_CAP = 900
 
-def get_chrome_cookies() -> dict[str, str]:
+# Successful post fetches are cached on disk for this long, so a restarted
+# run or download-media can reuse them while the CDN URLs are still valid
+POST_CACHE_TTL = 3600
+
+# download-media: seconds between post re-fetches
+MEDIA_REFETCH_DELAY = 2.5
+
+# download-media: how many posts' downloads may be outstanding while later
+# posts are fetched
+MAX_INFLIGHT_MEDIA_POSTS = 8
+
+# Reading Chrome's cookie DB means SQLite + keychain decryption, so the
+# result is reused for a few minutes
+COOKIE_CACHE_TTL = 300
+_cookie_cache: tuple[dict[str, str], float] | None = None
+
+
+def get_chrome_cookies(force: bool = False) -> dict[str, str]:
     """Extract Instagram cookies from Chrome's cookie database.
 
     Uses browser_cookie3 to read Chrome's encrypted cookie store,
     which can access HttpOnly cookies like sessionid that JavaScript cannot.
+    The result is cached for COOKIE_CACHE_TTL seconds; pass force=True to
+    re-read it (e.g. after Instagram rotated the session).
     """
+    global _cookie_cache
+    if not force and _cookie_cache is not None:
+        cookies, fetched_at = _cookie_cache
+        if time.monotonic() - fetched_at < COOKIE_CACHE_TTL:
+            return dict(cookies)
+
     import browser_cookie3
 
     cj = browser_cookie3.chrome(domain_name=".instagram.com")
@@ -69,12 +128,76 @@ def get_chrome_cookies() -> dict[str, str]:
             "Make sure you're logged into Instagram in Chrome."
         )
 
-    return cookies
+    _cookie_cache = (cookies, time.monotonic())
+    return dict(cookies)
 
 
-def build_session(cookies: dict[str, str]) -> requests.Session:
-    """Build a requests session with Instagram's expected headers and cookies."""
+def _mount_pooled_adapter(
+    session: requests.Session,
+    retry_statuses: tuple[int, ...],
+    retry_methods: frozenset[str] | None = None,
+    pool_maxsize: int = POOL_MAXSIZE,
+) -> None:
+    """Mount a keep-alive pool with transport-level retries on the session.
+
+    Retries cover connection errors and the given statuses with exponential
+    backoff (honoring Retry-After). Status retries apply to urllib3's
+    idempotent methods unless retry_methods is given. requests' default
+    Accept-Encoding comes from urllib3 (gzip, deflate, plus br when brotli
+    is installed), so responses arrive compressed.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=retry_statuses,
+        allowed_methods=retry_methods or Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+# Media download pools, shared by every run in the process (keyed by size)
+_download_pools: dict[int, ThreadPoolExecutor] = {}
+_download_pools_lock = threading.Lock()
+
+
+def get_download_pool(max_workers: int = 4) -> ThreadPoolExecutor:
+    """Return the process-wide media download pool with max_workers threads.
+
+    Created on first use and reused by later runs in the same process, so
+    repeated syncs don't respawn worker threads. Callers must not shut it
+    down; its threads are joined at interpreter exit.
+    """
+    with _download_pools_lock:
+        pool = _download_pools.get(max_workers)
+        if pool is None:
+            pool = _download_pools[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="media-download"
+            )
+        return pool
+
+
+def build_session(cookies: dict[str, str], pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """Build a requests session with Instagram's expected headers and cookies.
+
+    Transient gateway errors (including Cloudflare's 522/524) are retried
+    in the adapter, for the GraphQL POST too since it's a read-only query.
+    429s are not retried here — callers back off on rate limits themselves.
+    """
+    import requests
+
     session = requests.Session()
+    _mount_pooled_adapter(
+        session,
+        retry_statuses=(502, 503, 504, 522, 524),
+        retry_methods=frozenset({"GET", "POST"}),
+        pool_maxsize=pool_maxsize,
+    )
 
     # Set cookies
     for name, value in cookies.items():
@@ -97,49 +220,80 @@ def build_session(cookies: dict[str, str]) -> requests.Session:
     return session
 
 
+def build_media_session() -> requests.Session:
+    """Build a pooled session for CDN media downloads.
+
+    CDN URLs are pre-signed, so no Instagram cookies or API headers are sent.
+    Share one across download threads to reuse TLS connections.
+    """
+    import requests
+
+    session = requests.Session()
+    _mount_pooled_adapter(session, retry_statuses=(429, 502, 503, 504))
+    session.headers["User-Agent"] = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
+    return session
+
+
+_media_session: requests.Session | None = None
+_media_session_lock = threading.Lock()
+
+
+def get_media_session() -> requests.Session:
+    """Return the process-wide CDN session, built on first use."""
+    global _media_session
+    with _media_session_lock:
+        if _media_session is None:
+            _media_session = build_media_session()
+        return _media_session
+
+
 def shortcode_to_pk(shortcode: str) -> int:
     """Convert an Instagram shortcode to its numeric media PK.
 
     Instagram shortcodes are base64-encoded (custom alphabet) representations
     of the numeric media primary key. Decoding is a simple base-64 accumulation.
+    Raises ValueError on characters outside the alphabet.
     """
-    pk = 0
-    for char in shortcode:
-        pk = pk * 64 + _IG_ALPHABET.index(char)
-    return pk
+    if not _SHORTCODE_RE.fullmatch(shortcode):
+        raise ValueError(f"Invalid shortcode {shortcode!r}")
+    # Left-pad with "A" (zero digits) to whole 4-char groups, which leaves
+    # the value unchanged, then decode and read the bytes as one integer
+    padded = "A" * (-len(shortcode) % 4) + shortcode
+    return int.from_bytes(base64.urlsafe_b64decode(padded), "big")
+
+
+def _append_node_media(media: list[dict], node: dict) -> None:
+    """Append the best image and video rendition of one item/carousel node."""
+    versions = node.get("image_versions2")
+    if versions:
+        candidates = versions.get("candidates")
+        if candidates:
+            img = candidates[0]
+            get = img.get
+            media.append({"type": "image", "url": get("url", ""),
+                          "w": get("width", 0), "h": get("height", 0)})
+    videos = node.get("video_versions")
+    if videos:
+        get = videos[0].get
+        media.append({"type": "video", "url": get("url", ""),
+                      "w": get("width", 0), "h": get("height", 0)})
 
 
 def _extract_media_from_item(item: dict) -> list[dict]:
     """Extract media list from an Instagram API item (shared by GraphQL and REST)."""
-    media = []
-    img_versions = (item.get("image_versions2") or {}).get("candidates")
-    if img_versions:
-        img = img_versions[0]
-        media.append({"type": "image", "url": img.get("url", ""),
-                      "w": img.get("width", 0), "h": img.get("height", 0)})
-    if item.get("video_versions"):
-        vid = item["video_versions"][0]
-        media.append({"type": "video", "url": vid.get("url", ""),
-                      "w": vid.get("width", 0), "h": vid.get("height", 0)})
-    if item.get("carousel_media"):
-        for cm in item["carousel_media"]:
-            cm_img = (cm.get("image_versions2") or {}).get("candidates")
-            if cm_img:
-                img = cm_img[0]
-                media.append({"type": "image", "url": img.get("url", ""),
-                              "w": img.get("width", 0), "h": img.get("height", 0)})
-            if cm.get("video_versions"):
-                vid = cm["video_versions"][0]
-                media.append({"type": "video", "url": vid.get("url", ""),
-                              "w": vid.get("width", 0), "h": vid.get("height", 0)})
+    media: list[dict] = []
+    _append_node_media(media, item)
+    carousel = item.get("carousel_media")
+    if carousel:
+        for cm in carousel:
+            _append_node_media(media, cm)
     return media
 
 
 def _item_to_result(shortcode: str, item: dict) -> dict:
     """Convert an Instagram API item to our standard result format."""
-    caption_text = ""
-    if item.get("caption") and item["caption"].get("text"):
-        caption_text = item["caption"]["text"]
+    caption = item.get("caption")
+    caption_text = (caption.get("text") if caption else None) or ""
 
     user = item.get("user", {})
 
@@ -158,6 +312,23 @@ def _item_to_result(shortcode: str, item: dict) -> dict:
     }
 
 
+def _retry_after(resp: requests.Response) -> float | None:
+    """Seconds to wait according to a Retry-After header, if present."""
+    return parse_retry_after(resp.headers.get("Retry-After"))
+
+
+def _is_html(resp: requests.Response) -> bool:
+    """True if a 200 response is an HTML page (login/checkpoint) rather than JSON.
+
+    Checked before parsing so a large HTML body isn't fed to the JSON
+    decoder just to raise. Instagram serves its JSON as text/javascript
+    too, so look at the first byte rather than requiring a json type.
+    """
+    if "html" in resp.headers.get("Content-Type", ""):
+        return True
+    return _HTML_START_RE.match(resp.content) is not None
+
+
 def fetch_post_rest(session: requests.Session, shortcode: str) -> dict:
     """Fetch a post via Instagram's REST API (v1/media/{pk}/info/).
 
@@ -165,6 +336,8 @@ def fetch_post_rest(session: requests.Session, shortcode: str) -> dict:
     to a numeric PK, then hits the REST endpoint which uses a different
     rate-limiting path than GraphQL.
     """
+    import requests
+
     try:
         pk = shortcode_to_pk(shortcode)
     except (ValueError, IndexError):
@@ -181,13 +354,15 @@ def fetch_post_rest(session: requests.Session, shortcode: str) -> dict:
         return {"shortcode": shortcode, "status": "not_found"}
 
     if resp.status_code == 429:
-        return {"shortcode": shortcode, "status": "rate_limited"}
+        return {"shortcode": shortcode, "status": "rate_limited", "retry_after": _retry_after(resp)}
 
     if resp.status_code != 200:
         return {"shortcode": shortcode, "status": "error", "code": resp.status_code}
 
+    if _is_html(resp):
+        return {"shortcode": shortcode, "status": "error", "message": "invalid json"}
     try:
-        data = resp.json()
+        data = jsonio.loads(resp.content)
     except ValueError:
         return {"shortcode": shortcode, "status": "error", "message": "invalid json"}
 
@@ -200,9 +375,11 @@ def fetch_post_rest(session: requests.Session, shortcode: str) -> dict:
 
 def _fetch_post_graphql(session: requests.Session, shortcode: str) -> dict:
     """Fetch a post via Instagram's GraphQL API (primary method)."""
+    import requests
+
     payload = {
         "doc_id": GRAPHQL_DOC_ID,
-        "variables": json.dumps({"shortcode": shortcode}),
+        "variables": jsonio.dumps({"shortcode": shortcode}).decode(),
     }
 
     try:
@@ -215,13 +392,15 @@ def _fetch_post_graphql(session: requests.Session, shortcode: str) -> dict:
         return {"shortcode": shortcode, "status": "error", "message": str(e)}
 
     if resp.status_code == 429:
-        return {"shortcode": shortcode, "status": "rate_limited"}
+        return {"shortcode": shortcode, "status": "rate_limited", "retry_after": _retry_after(resp)}
 
     if resp.status_code != 200:
         return {"shortcode": shortcode, "status": "error", "code": resp.status_code}
 
+    if _is_html(resp):
+        return {"shortcode": shortcode, "status": "error", "message": "invalid json"}
     try:
-        data = resp.json()
+        data = jsonio.loads(resp.content)
     except ValueError:
         return {"shortcode": shortcode, "status": "error", "message": "invalid json"}
 
@@ -240,39 +419,63 @@ def _fetch_post_graphql(session: requests.Session, shortcode: str) -> dict:
 _graphql_available = True
 
 
-def fetch_post_by_shortcode(session: requests.Session, shortcode: str) -> dict:
+def _post_cache() -> FileCache:
+    return FileCache(config.CACHE_DIR / "instagram_posts", ttl=POST_CACHE_TTL)
+
+
+def fetch_post_by_shortcode(
+    session: requests.Session, shortcode: str, use_cache: bool = True
+) -> dict:
     """Fetch a single post's data, trying GraphQL first then REST fallback.
 
     If GraphQL returns a checkpoint (invalid json / HTML), automatically
     switches to REST-only mode for the remainder of the session.
 
+    Successful results are cached on disk for POST_CACHE_TTL seconds and
+    served from there on repeat calls; failures are never cached.
+
     Returns a dict with status and post data, matching the format
     used by apply_results().
     """
     global _graphql_available
 
+    cache = _post_cache() if use_cache else None
+    if cache is not None:
+        cached = cache.get(shortcode)
+        if cached is not None:
+            return cached
+
+    result = None
     if _graphql_available:
         result = _fetch_post_graphql(session, shortcode)
-        if result["status"] != "error" or result.get("message") != "invalid json":
-            return result
+        if result["status"] == "error" and result.get("message") == "invalid json":
+            # GraphQL returned HTML (checkpoint) — switch to REST-only
+            logger.info("GraphQL checkpointed, switching to REST API")
+            _graphql_available = False
+            result = None
 
-        # GraphQL returned HTML (checkpoint) — switch to REST-only
-        logger.info("GraphQL checkpointed, switching to REST API")
-        _graphql_available = False
+    if result is None:
+        result = fetch_post_rest(session, shortcode)
 
-    return fetch_post_rest(session, shortcode)
+    if cache is not None and result["status"] == "ok":
+        cache.set(shortcode, result)
+    return result
 
 
 def _url_hash(url: str) -> str:
-    """Short hash of a URL for unique filenames."""
+    """Short hash of a URL for unique filenames (12 hex chars)."""
+    return hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
+
+
+def _legacy_url_hash(url: str) -> str:
+    """Filename hash used before _url_hash switched to BLAKE2b."""
     return hashlib.sha256(url.encode()).hexdigest()[:12]
 
 
 def _guess_ext(url: str, media_type: str) -> str:
     """Guess file extension from URL path or media type."""
-    path = urlparse(url).path.split("?")[0]
-    ext = Path(path).suffix.lower()
-    if ext in (".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp4", ".mov", ".webm"):
+    ext = Path(urlparse(url).path).suffix.lower()
+    if ext in _MEDIA_EXTS:
         return ext
     return ".mp4" if media_type == "video" else ".jpg"
 
@@ -282,14 +485,17 @@ def download_post_media(
     username: str,
     media_list: list[dict],
     base_dir: Path | None = None,
+    session: requests.Session | None = None,
 ) -> list[dict]:
     """Download all media items for a single post.
 
     Downloads each media URL to data/media/instagram/{username}/{shortcode}_{hash}.{ext}.
     Returns updated media_list with local_path set for each successful download.
-    Uses a plain requests.get() — CDN URLs don't need Instagram auth cookies.
+    Uses the shared get_media_session() unless a session is given, so
+    keep-alive connections are reused across files and posts.
     """
-    base = base_dir or (MEDIA_DIR / "instagram")
+    session = session or get_media_session()
+    base = base_dir or (config.MEDIA_DIR / "instagram")
     safe_user = "".join(c for c in username if c.isalnum() or c in "._-") or "unknown"
     target_dir = base / safe_user
     target_dir.mkdir(parents=True, exist_ok=True)
@@ -305,20 +511,30 @@ def download_post_media(
         filename = f"{shortcode}_{_url_hash(url)}{ext}"
         filepath = target_dir / filename
 
-        # Skip if already downloaded
+        # Skip if already downloaded (possibly under the pre-BLAKE2b name)
         if filepath.exists() and filepath.stat().st_size > 0:
             updated.append({**m, "local_path": str(filepath)})
             continue
+        legacy_path = target_dir / f"{shortcode}_{_legacy_url_hash(url)}{ext}"
+        if legacy_path.exists() and legacy_path.stat().st_size > 0:
+            updated.append({**m, "local_path": str(legacy_path)})
+            continue
 
+        # Stream into a .part file and rename when complete, so memory stays
+        # at one chunk per worker and an interrupted download never leaves a
+        # truncated file under the final name
+        part_path = filepath.with_name(filepath.name + ".part")
         try:
-            resp = requests.get(url, timeout=30, headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)"
-            })
-            resp.raise_for_status()
-            filepath.write_bytes(resp.content)
+            with session.get(url, timeout=30, stream=True) as resp:
+                resp.raise_for_status()
+                resp.raw.decode_content = True
+                with open(part_path, "wb") as f:
+                    shutil.copyfileobj(resp.raw, f, DOWNLOAD_CHUNK_SIZE)
+            os.replace(part_path, filepath)
             updated.append({**m, "local_path": str(filepath)})
         except Exception as e:
             logger.warning(f"Failed to download media for {shortcode}: {e}")
+            part_path.unlink(missing_ok=True)
             updated.append(m)
 
     return updated
@@ -334,102 +550,110 @@ def get_pending_shortcodes(
         limit: Max shortcodes to return.
         collection: Only include posts in this collection (substring match).
     """
-    store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
-    posts = store.read()
-    pending = []
-    for post in posts:
-        if post.get("source") == "archive" and not post.get("text"):
-            if collection:
-                post_cols = post.get("collections", [])
-                if not any(collection.lower() in c.lower() for c in post_cols):
-                    continue
-            pending.append(post["id"])
-            if limit and len(pending) >= limit:
-                break
-    return pending
+    store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
+    col_lc = collection.lower() if collection else None
+
+    def needs_enrichment(post: dict) -> bool:
+        if post.get("source") != "archive" or post.get("text"):
+            return False
+        return col_lc is None or any(col_lc in c.lower() for c in post.get("collections", ()))
+
+    return list(islice((p["id"] for p in store.read() if needs_enrichment(p)), limit or None))
+
+
+_PROFILE_URL = "https://www.instagram.com/{}/"
+_DELETED_PATCH = {
+    "source": "archive:deleted",
+    "text": "[Post no longer available]",
+}
+
+
+def _make_patch(result: dict) -> dict | None:
+    """Store fields to update for one fetch result (None if nothing to write)."""
+    status = result["status"]
+    if status == "not_found":
+        return dict(_DELETED_PATCH)
+    if status != "ok":
+        return None
+
+    get = result.get
+    username = get("username", "")
+    patch = {
+        "text": get("caption") or "[No caption]",
+        "author": {
+            "username": username,
+            "display_name": get("full_name", ""),
+            "profile_url": _PROFILE_URL.format(username),
+        },
+        "source": "archive+api",
+    }
+
+    media = get("media")
+    if media:
+        patch["media"] = [
+            {
+                "url": m.get("url", ""),
+                "media_type": m.get("type", "image"),
+                "local_path": m.get("local_path", ""),
+                "alt_text": "",
+                "width": m.get("w", 0),
+                "height": m.get("h", 0),
+            }
+            for m in media
+        ]
+
+    if like_count := get("like_count"):
+        patch["like_count"] = like_count
+    if comment_count := get("comment_count"):
+        patch["reply_count"] = comment_count
+    if taken_at := get("taken_at"):
+        patch["created_at"] = utc_iso(taken_at)
+    if pk := get("pk"):
+        patch["media_pk"] = pk
+    return patch
+
+
+def count_pending() -> int:
+    """Number of archive-only posts in the store that still need enrichment."""
+    return sum(
+        1 for p in JsonStore(config.DATA_FILES["instagram"]["saved_posts"]).read()
+        if p.get("source") == "archive" and not p.get("text")
+    )
 
 
-def apply_results(results: list[dict]) -> dict:
+def apply_results(results: list[dict], remaining: int | None = None) -> dict:
     """Apply fetched results to the data store using patch_items.
 
     Uses merge-on-write to avoid clobbering extraction data written by
     the media_extractor pipeline running concurrently.
 
+    Args:
+        results: Fetch results from fetch_post_by_shortcode().
+        remaining: Pending count before this batch. When given, the new
+            count is derived from it instead of re-reading the whole store.
+
     Returns dict with counts: enriched, deleted, failed, remaining.
     """
-    store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
-
-    enriched = 0
-    deleted = 0
-    failed = 0
-    patches: dict[str, dict] = {}
-
-    for result in results:
-        sc = result["shortcode"]
-
-        if result["status"] == "ok":
-            patch = {
-                "text": result.get("caption") or "[No caption]",
-                "author": {
-                    "username": result.get("username", ""),
-                    "display_name": result.get("full_name", ""),
-                    "profile_url": f"https://www.instagram.com/{result.get('username', '')}/",
-                },
-                "source": "archive+api",
-            }
-
-            if result.get("media"):
-                patch["media"] = [
-                    {
-                        "url": m.get("url", ""),
-                        "media_type": m.get("type", "image"),
-                        "local_path": m.get("local_path", ""),
-                        "alt_text": "",
-                        "width": m.get("w", 0),
-                        "height": m.get("h", 0),
-                    }
-                    for m in result["media"]
-                ]
-
-            if result.get("like_count"):
-                patch["like_count"] = result["like_count"]
-            if result.get("comment_count"):
-                patch["reply_count"] = result["comment_count"]
-
-            if result.get("taken_at"):
-                patch["created_at"] = datetime.fromtimestamp(
-                    result["taken_at"], tz=timezone.utc
-                ).isoformat()
-
-            if result.get("pk"):
-                patch["media_pk"] = result["pk"]
-
-            patches[sc] = patch
-            enriched += 1
+    store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
 
-        elif result["status"] == "not_found":
-            patches[sc] = {
-                "source": "archive:deleted",
-                "text": "[Post no longer available]",
-            }
-            deleted += 1
-
-        else:
-            failed += 1
+    patches = {
+        r["shortcode"]: patch for r in results if (patch := _make_patch(r)) is not None
+    }
+    enriched = sum(1 for r in results if r["status"] == "ok")
+    deleted = sum(1 for r in results if r["status"] == "not_found")
+    failed = len(results) - enriched - deleted
 
     store.patch_items(patches)
 
-    # Read fresh to count remaining
-    posts = store.read()
-    remaining = sum(
-        1 for p in posts
-        if p.get("source") == "archive" and not p.get("text")
-    )
+    if remaining is None:
+        remaining = count_pending()
+    else:
+        remaining = max(0, remaining - enriched - deleted)
 
     tracker = SyncTracker()
     cursor = tracker.get("instagram", "enrichment")
     cursor.mark_success(total_items=enriched)
-    tracker.save(cursor)
+    tracker.save(cursor, durable=True)
 
     return {
         "enriched": enriched,
@@ -439,12 +663,39 @@ def apply_results(results: list[dict]) -> dict:
     }
 
 
+class _StatusLine:
+    """Per-post status characters, written out at most once per interval.
+
+    Flushing stdout after every character costs a write() per post when
+    output is piped or unbuffered; buffering keeps the live view while
+    batching the syscalls. Call flush() before printing anything else.
+    """
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._buf: list[str] = []
+        self._last = time.monotonic()
+
+    def add(self, char: str) -> None:
+        self._buf.append(char)
+        if time.monotonic() - self._last >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buf:
+            sys.stdout.write("".join(self._buf))
+            self._buf.clear()
+        sys.stdout.flush()
+        self._last = time.monotonic()
+
+
 def run_enrichment(
     limit: int | None = None,
     delay: float = 3.0,
     save_every: int = 25,
     download_media: bool = True,
     collection: str | None = None,
+    concurrency: int = 1,
 ):
     """Run the full enrichment pipeline autonomously.
 
@@ -453,16 +704,25 @@ def run_enrichment(
         delay: Seconds between requests (default 3.0 for safety).
         save_every: Save progress every N posts.
         download_media: Download media files inline (default True).
+        concurrency: Max API requests in flight. Request starts are still
+            paced at one per delay; this only overlaps slow responses.
     """
     print("Loading Chrome cookies...")
     cookies = get_chrome_cookies()
-    session = build_session(cookies)
+    # Enough keep-alive connections for every concurrent fetch
+    pool_maxsize = max(POOL_MAXSIZE, concurrency)
+    session = build_session(cookies, pool_maxsize)
     print(f"Authenticated as user {cookies.get('ds_user_id', '?')}")
 
+    # Paces request starts to one per `delay` seconds; time spent in the
+    # request itself counts towards the gap
+    limiter = RateLimiter(rate=1 / delay)
+
     # Quick auth test — tries GraphQL first, falls back to REST
     global _graphql_available
     _graphql_available = True  # Reset for fresh session
-    test = fetch_post_by_shortcode(session, "DUGZG3CjcN-")  # known test shortcode
+    limiter.acquire()
+    test = fetch_post_by_shortcode(session, "DUGZG3CjcN-", use_cache=False)  # known test shortcode
     if test["status"] == "error":
         print(f"Auth test failed: {test}")
         print("Make sure you're logged into Instagram in Chrome.")
@@ -470,11 +730,17 @@ def run_enrichment(
     api_mode = "GraphQL" if _graphql_available else "REST API (GraphQL checkpointed)"
     print(f"Auth test passed via {api_mode} (fetched @{test.get('username', '?')})")
 
+    # Enriched posts are never looked up again, so their cache entries only
+    # go away when expired files are swept here
+    _post_cache().prune()
+
     pending = get_pending_shortcodes(limit=limit, collection=collection)
     total_pending = len(pending)
     if not pending:
         print("No posts need enrichment.")
         return
+    # Store-wide pending count, kept up to date per batch by apply_results()
+    remaining = total_pending if limit is None and not collection else count_pending()
 
     media_mode = "with media download" if download_media else "metadata only"
     col_str = f" in \"{collection}\"" if collection else ""
@@ -492,6 +758,8 @@ def run_enrichment(
     media_failed = 0
     media_bytes = 0
     rate_limited = False
+    retry_after = None
+    rate_limit_streak = 0
     consecutive_failures = 0
 
     # Instagram's anti-automation kicks in after ~700 requests in a session.
@@ -503,14 +771,34 @@ def run_enrichment(
 
     # Thread pool for concurrent media downloads — CDN requests don't count
     # against the GraphQL rate limit, so downloads run during API sleep time.
-    executor = ThreadPoolExecutor(max_workers=4) if download_media else None
+    executor = get_download_pool() if download_media else None
     # Maps: future -> index in results_batch
     pending_futures: list[tuple] = []
 
+    # Up to `concurrency` fetches run ahead of the post being processed.
+    # Results are consumed in order, so progress and saves stay deterministic.
+    fetch_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="enrich-fetch")
+    inflight: deque[Future] = deque()
+    next_idx = 0
+
+    def abandon_inflight() -> None:
+        """Wait out in-flight fetches and queue their posts to be refetched."""
+        nonlocal next_idx
+        wait(inflight)
+        next_idx -= len(inflight)
+        inflight.clear()
+
     start_time = time.time()
+    progress = _StatusLine()
 
     for i, shortcode in enumerate(pending):
-        result = fetch_post_by_shortcode(session, shortcode)
+        # Start more fetches while the oldest is still running
+        while (next_idx < total_pending and len(inflight) < concurrency
+               and not (inflight and inflight[0].done())):
+            limiter.acquire()
+            inflight.append(fetch_pool.submit(fetch_post_by_shortcode, session, pending[next_idx]))
+            next_idx += 1
+        result = inflight.popleft().result()
         results_batch.append(result)
 
         # Submit media downloads to thread pool (non-blocking)
@@ -531,19 +819,24 @@ def run_enrichment(
         if result["status"] == "ok":
             enriched_total += 1
             consecutive_failures = 0
+            rate_limit_streak = 0
+            limiter.increase()
         elif result["status"] == "not_found":
             deleted_total += 1
             consecutive_failures = 0
+            rate_limit_streak = 0
+            limiter.increase()
         elif result["status"] == "rate_limited":
             rate_limited = True
+            retry_after = result.get("retry_after")
             consecutive_failures += 1
+            limiter.decrease()
         else:
             failed_total += 1
             consecutive_failures += 1
 
         # Progress output (compact line, no newline until save)
-        sys.stdout.write(status_char)
-        sys.stdout.flush()
+        progress.add(status_char)
 
         # Proactive cooldown every COOLDOWN_EVERY posts to avoid anti-automation
         needs_cooldown = (
@@ -570,7 +863,7 @@ def run_enrichment(
                     logger.warning(f"Media download failed: {e}")
             pending_futures.clear()
 
-            counts = apply_results(results_batch)
+            counts = apply_results(results_batch, remaining)
             results_batch = []
 
             elapsed = time.time() - start_time
@@ -579,6 +872,7 @@ def run_enrichment(
 
             media_mb = media_bytes / (1024 * 1024)
             media_str = f" | {media_downloaded} media ({media_mb:.0f}MB)" if download_media else ""
+            progress.flush()
             print(f" [{i+1}/{total_pending}] "
                   f"+{counts['enriched']} enriched, "
                   f"{counts['deleted']} deleted, "
@@ -586,13 +880,26 @@ def run_enrichment(
                   f"{remaining} remaining | "
                   f"{rate:.0f}/min{media_str}")
 
+        if rate_limited or needs_cooldown:
+            # Requests already sent during the pause would be wasted
+            abandon_inflight()
+
         if rate_limited:
-            print("\nRate limited! Backing off for 60 seconds...")
-            time.sleep(60)
-            # Refresh cookies in case session rotated
+            if retry_after is not None:
+                backoff = retry_after
+            else:
+                backoff = min(RATE_LIMIT_BACKOFF_CAP, RATE_LIMIT_BACKOFF * 2 ** rate_limit_streak)
+                backoff *= random.uniform(0.5, 1.5)
+            rate_limit_streak += 1
+            print(f"\nRate limited! Backing off for {backoff:.0f} seconds "
+                  f"(then ~{limiter.rate * 60:.0f} req/min)...")
+            time.sleep(backoff)
+            # Re-read cookies in case the session rotated
             try:
-                cookies = get_chrome_cookies()
-                session = build_session(cookies)
+                fresh = get_chrome_cookies(force=True)
+                if fresh != cookies:
+                    cookies = fresh
+                    session = build_session(cookies, pool_maxsize)
                 rate_limited = False
                 consecutive_failures = 0
                 print("Resumed after rate limit pause.")
@@ -606,21 +913,21 @@ def run_enrichment(
                       else f"proactive cooldown at {i+1} posts")
             print(f"\nCooling down ({reason}): pausing {COOLDOWN_SECS}s...")
             time.sleep(COOLDOWN_SECS)
-            # Refresh cookies after cooldown
+            # Refresh cookies after cooldown. A failure streak may mean the
+            # session rotated, so bypass the cookie cache in that case.
             try:
-                cookies = get_chrome_cookies()
-                session = build_session(cookies)
+                fresh = get_chrome_cookies(force=consecutive_failures >= MAX_CONSECUTIVE_FAILURES)
+                if fresh != cookies:
+                    cookies = fresh
+                    session = build_session(cookies, pool_maxsize)
                 consecutive_failures = 0
                 print("Resumed after cooldown.")
             except Exception as e:
                 print(f"Failed to refresh cookies: {e}")
                 break
 
-        elif i < len(pending) - 1:
-            time.sleep(delay)
-
-    if executor:
-        executor.shutdown(wait=True)
+    fetch_pool.shutdown(wait=True, cancel_futures=True)
+    progress.flush()
 
     # Final summary
     elapsed = time.time() - start_time
@@ -635,11 +942,7 @@ def run_enrichment(
         if media_failed:
             print(f"  Media failed: {media_failed}")
 
-    remaining = sum(
-        1 for p in JsonStore(DATA_FILES["instagram"]["saved_posts"]).read()
-        if p.get("source") == "archive" and not p.get("text")
-    )
-    print(f"  Remaining: {remaining}")
+    print(f"  Remaining: {count_pending()}")
 
 
 def run_media_download(limit: int | None = None):
@@ -653,22 +956,18 @@ def run_media_download(limit: int | None = None):
     session = build_session(cookies)
     print(f"Authenticated as user {cookies.get('ds_user_id', '?')}")
 
-    store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
-    posts = store.read()
+    store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
 
     # Find enriched posts missing media downloads
     needs_media = []
-    for post in posts:
+    for post in store.read():
         if post.get("source") != "archive+api":
             continue
-        for m in post.get("media", []):
-            if m.get("url") and not m.get("local_path"):
-                needs_media.append(post)
+        if any(m.get("url") and not m.get("local_path") for m in post.get("media", [])):
+            needs_media.append(post)
+            if limit and len(needs_media) >= limit:
                 break
 
-    if limit:
-        needs_media = needs_media[:limit]
-
     if not needs_media:
         print("No posts need media downloads.")
         return
@@ -679,30 +978,35 @@ def run_media_download(limit: int | None = None):
     downloaded_total = 0
     failed_total = 0
     bytes_total = 0
+    completed = 0
+    # Only the media field is written back, so concurrent pipelines'
+    # updates to other fields aren't clobbered
+    patches: dict[str, dict] = {}
 
-    sc_to_idx = {p["id"]: i for i, p in enumerate(posts)}
-
-    for i, post in enumerate(needs_media):
-        shortcode = post["id"]
-        result = fetch_post_by_shortcode(session, shortcode)
-
-        if result["status"] != "ok" or not result.get("media"):
-            sys.stdout.write("?")
-            sys.stdout.flush()
-            failed_total += 1
-            time.sleep(2.5)
-            continue
-
-        updated_media = download_post_media(
-            shortcode=shortcode,
-            username=result.get("username", post.get("author", {}).get("username", "unknown")),
-            media_list=result["media"],
-        )
+    cache = _post_cache()
+    cache.prune()
+    progress = _StatusLine()
+    # API re-fetches are paced; CDN downloads run on the shared pool while
+    # the next post is fetched, and are collected in submission order
+    limiter = RateLimiter(rate=1 / MEDIA_REFETCH_DELAY)
+    download_pool = get_download_pool()
+    inflight: deque[tuple[str, Future]] = deque()
+
+    def collect(block: bool) -> None:
+        nonlocal downloaded_total, failed_total, bytes_total, completed
+        while inflight and (block or inflight[0][1].done()
+                            or len(inflight) >= MAX_INFLIGHT_MEDIA_POSTS):
+            shortcode, future = inflight.popleft()
+            try:
+                updated_media = future.result()
+            except Exception as e:
+                logger.warning(f"Media download failed for {shortcode}: {e}")
+                progress.add("?")
+                failed_total += 1
+                continue
 
-        # Update the post's media with local paths
-        idx = sc_to_idx.get(shortcode)
-        if idx is not None:
-            posts[idx]["media"] = [
+            # Update the post's media with local paths
+            patches[shortcode] = {"media": [
                 {
                     "url": m.get("url", ""),
                     "media_type": m.get("type", "image"),
@@ -712,27 +1016,49 @@ def run_media_download(limit: int | None = None):
                     "height": m.get("h", 0),
                 }
                 for m in updated_media
-            ]
-
-        for m in updated_media:
-            if m.get("local_path"):
-                lp = Path(m["local_path"])
-                if lp.exists():
-                    downloaded_total += 1
-                    bytes_total += lp.stat().st_size
-
-        sys.stdout.write(".")
-        sys.stdout.flush()
-
-        # Save every 25 posts
-        if (i + 1) % 25 == 0 or i == len(needs_media) - 1:
-            store.write(posts)
-            mb = bytes_total / (1024 * 1024)
-            print(f" [{i+1}/{len(needs_media)}] {downloaded_total} files ({mb:.0f}MB)")
+            ]}
+
+            for m in updated_media:
+                if m.get("local_path"):
+                    lp = Path(m["local_path"])
+                    if lp.exists():
+                        downloaded_total += 1
+                        bytes_total += lp.stat().st_size
+
+            progress.add(".")
+            completed += 1
+
+            # Save every 25 posts
+            if completed % 25 == 0:
+                store.patch_items(patches)
+                patches.clear()
+                mb = bytes_total / (1024 * 1024)
+                progress.flush()
+                print(f" [{completed}/{len(needs_media)}] {downloaded_total} files ({mb:.0f}MB)")
+
+    for post in needs_media:
+        shortcode = post["id"]
+        # A fresh cached response still has valid CDN URLs — no request needed
+        result = cache.get(shortcode)
+        if result is None:
+            limiter.acquire()
+            result = fetch_post_by_shortcode(session, shortcode)
 
-        time.sleep(2.5)
+        if result["status"] != "ok" or not result.get("media"):
+            progress.add("?")
+            failed_total += 1
+        else:
+            inflight.append((shortcode, download_pool.submit(
+                download_post_media,
+                shortcode=shortcode,
+                username=result.get("username", post.get("author", {}).get("username", "unknown")),
+                media_list=result["media"],
+            )))
+        collect(block=False)
 
-    store.write(posts)
+    collect(block=True)
+    progress.flush()
+    store.patch_items(patches)
     mb = bytes_total / (1024 * 1024)
     print(f"\n{'='*50}")
     print(f"Media download complete")
@@ -763,6 +1089,8 @@ def main():
                             help="Skip media download (metadata only)")
     run_parser.add_argument("--collection", type=str, default=None,
                             help="Only enrich posts in this collection (substring match)")
+    run_parser.add_argument("--concurrency", type=int, default=1,
+                            help="Max API requests in flight, still paced by --delay (default: 1)")
 
     dm_parser = sub.add_parser("download-media",
                                help="Download media for already-enriched posts")
@@ -781,6 +1109,7 @@ def main():
             save_every=args.save_every,
             download_media=not args.no_media,
             collection=args.collection,
+            concurrency=args.concurrency,
         )
 
     elif args.command == "download-media":
@@ -798,7 +1127,7 @@ def main():
             print(f"Est. time: ~{eta:.0f} min ({eta/60:.1f} hrs) at 20/min")
 
         # Media stats
-        media_dir = MEDIA_DIR / "instagram"
+        media_dir = config.MEDIA_DIR / "instagram"
         if media_dir.exists():
             files = list(media_dir.rglob("*"))
             media_files = [f for f in files if f.is_file() and f.suffix in (
@@ -808,7 +1137,7 @@ def main():
             print(f"\nMedia:     {len(media_files)} files ({mb:.1f} MB)")
 
             # Count posts with vs without local media
-            store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
+            store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
             posts = store.read()
             with_media = sum(1 for p in posts if any(
                 m.get("local_path") for m in p.get("media", [])))
@@ -17,154 +17,424 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import json
 import logging
+import os
+import queue
+import re
+import shutil
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+import wave
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
-from socmed.config import DATA_FILES
+from socmed import config
+from socmed.storage.file_cache import FileCache
 from socmed.storage.json_store import JsonStore
+from socmed.utils import jsonio
 
 logger = logging.getLogger(__name__)
 
 # Frame sampling interval for video OCR (seconds)
 FRAME_INTERVAL_SECS = 3.0
 
+# Longest side images and frames are scaled down to before OCR. Vision's
+# accurate mode scales with pixel count, and captions stay legible at this size
+OCR_MAX_DIMENSION = 1280
+
+# Sampled frames whose 64-bit difference hash is within this many bits of
+# the last kept frame are dropped before OCR (static overlays, slow pans)
+FRAME_DHASH_MAX_DISTANCE = 4
+
 # Minimum OCR confidence to include a text result
 MIN_OCR_CONFIDENCE = 0.5
 
 # Minimum text length to keep (filters out single-char noise)
 MIN_TEXT_LENGTH = 2
 
+# Punctuation and whitespace runs, collapsed when comparing OCR texts
+_OCR_NOISE_RE = re.compile(r"[\W_]+")
+
+# Silence gate before Whisper: quiet stretches (below SILENCE_THRESHOLD_DB
+# for 1s+) are cut from the extracted audio, and videos with less than
+# MIN_SPEECH_SECS left are not transcribed at all
+SILENCE_THRESHOLD_DB = -45
+MIN_SPEECH_SECS = 1.0
+
+# Whisper model name (WHISPER_MODEL env var or --whisper-model)
+WHISPER_MODEL = os.environ.get("WHISPER_MODEL", "large-v3")
+
+# Greedy decoding at temperature 0 only: no re-decoding at higher
+# temperatures when a window fails the compression/logprob checks, and no
+# conditioning on the previous window (avoids repetition loops on music)
+WHISPER_DECODE_OPTIONS = {"temperature": 0.0, "condition_on_previous_text": False}
+
+# OCR worker processes (OCR_CONCURRENCY env var, default: one per CPU;
+# 1 runs OCR in-process)
+OCR_CONCURRENCY = int(os.environ.get("OCR_CONCURRENCY") or 0) or os.cpu_count() or 1
+
+# OCR and transcription results are cached by content hash of the image or
+# extracted audio, so re-runs after an interruption skip Vision/Whisper for
+# media already seen (ffmpeg output is deterministic for the same input)
+MEDIA_CACHE_TTL = 30 * 24 * 3600
+
+# Status for posts whose video failed to decode (ffmpeg error or timeout).
+# Unlike the other statuses these are picked up again by later runs, up to
+# MAX_DECODE_ATTEMPTS times, since audio and frames are both lost.
+DECODE_FAILED_STATUS = "partial:decode_failed"
+MAX_DECODE_ATTEMPTS = 3
+
+
+def _mlx_whisper_repo(model_name: str) -> str:
+    """Hugging Face repo with MLX weights for a lightning-style model name.
+
+    Names containing a slash are taken as a repo id as is.
+    """
+    if "/" in model_name:
+        return model_name
+    if model_name.startswith("distil-"):
+        return f"mlx-community/distil-whisper-{model_name[len('distil-'):]}"
+    if model_name.endswith("-turbo"):
+        return f"mlx-community/whisper-{model_name}"
+    return f"mlx-community/whisper-{model_name}-mlx"
 
-def _load_whisper():
+
+class _MlxWhisper:
+    """mlx-whisper behind the LightningWhisperMLX interface used here.
+
+    mlx-whisper is the maintained MLX port: it honours
+    WHISPER_DECODE_OPTIONS natively and supports large-v3-turbo, which
+    lightning-whisper-mlx has no weights for.
+    """
+
+    def __init__(self, model_name: str):
+        self.name = model_name
+        self.repo = _mlx_whisper_repo(model_name)
+
+    def transcribe(self, audio_path: str, language: str | None = None) -> dict:
+        import mlx_whisper
+
+        return mlx_whisper.transcribe(
+            audio_path, path_or_hf_repo=self.repo, language=language, **WHISPER_DECODE_OPTIONS
+        )
+
+
+def _load_whisper(model_name: str = WHISPER_MODEL):
     """Load the Whisper model once. Returns the model instance.
 
-    Uses large-v3 for multilingual support (needed for Norwegian recipe content).
+    Uses mlx-whisper if installed, lightning-whisper-mlx otherwise.
+    Defaults to large-v3 for multilingual support (needed for Norwegian
+    recipe content). The distil-* models are faster but English-only.
     The model takes ~10-15s to load but is then reused for all videos.
     """
-    from lightning_whisper_mlx import LightningWhisperMLX
+    if importlib.util.find_spec("mlx_whisper") is not None:
+        return _MlxWhisper(model_name)
 
-    return LightningWhisperMLX(model="large-v3", batch_size=12)
+    from lightning_whisper_mlx import LightningWhisperMLX
 
+    return LightningWhisperMLX(model=model_name, batch_size=12)
 
-def extract_audio_from_video(video_path: str | Path) -> str | None:
-    """Extract audio track from a video file to a temporary WAV file.
 
-    Uses ffmpeg to extract and convert audio to 16kHz mono WAV,
-    which is what Whisper expects.
+def _warm_up_whisper(whisper_model) -> None:
+    """Transcribe one second of silence so weights load and MLX compiles now.
 
-    Returns path to temp WAV file, or None if extraction fails.
-    The caller is responsible for cleaning up the temp file.
+    lightning-whisper-mlx only loads the weights on the first transcription;
+    doing that here keeps the one-off cost out of the first real video.
     """
-    video_path = Path(video_path)
-    if not video_path.exists():
-        return None
+    with tempfile.TemporaryDirectory(prefix="socmed_warmup_") as tmp:
+        path = os.path.join(tmp, "silence.wav")
+        with wave.open(path, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(16000)
+            w.writeframes(b"\0\0" * 16000)
+        try:
+            _transcribe_greedy(whisper_model, path)
+        except Exception as e:
+            logger.debug(f"Whisper warmup failed: {e}")
+
 
-    tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    tmp.close()
+def probe_video(video_path: str | Path) -> dict:
+    """Read duration and stream types of a video with ffprobe.
 
+    Returns dict with duration_secs (float), has_audio and has_video (bool).
+    All falsy if the file can't be probed.
+    """
+    info = {"duration_secs": 0.0, "has_audio": False, "has_video": False}
     try:
         result = subprocess.run(
             [
-                "ffmpeg", "-y",
-                "-i", str(video_path),
-                "-vn",                  # No video
-                "-acodec", "pcm_s16le", # 16-bit PCM
-                "-ar", "16000",         # 16kHz (Whisper's expected rate)
-                "-ac", "1",             # Mono
-                tmp.name,
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration:stream=codec_type",
+                "-of", "json",
+                str(video_path),
             ],
             capture_output=True,
-            timeout=60,
+            timeout=30,
         )
-        if result.returncode != 0:
-            Path(tmp.name).unlink(missing_ok=True)
-            return None
-        # Check the output file has actual content
-        if Path(tmp.name).stat().st_size < 1000:
-            Path(tmp.name).unlink(missing_ok=True)
-            return None
-        return tmp.name
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        Path(tmp.name).unlink(missing_ok=True)
-        return None
+        return info
+    if result.returncode != 0:
+        return info
 
+    try:
+        data = jsonio.loads(result.stdout)
+    except ValueError:
+        return info
+    types = {stream.get("codec_type") for stream in data.get("streams", [])}
+    info["has_audio"] = "audio" in types
+    info["has_video"] = "video" in types
+    try:
+        info["duration_secs"] = round(float(data.get("format", {}).get("duration", 0)), 1)
+    except (TypeError, ValueError):
+        pass
+    return info
 
-def transcribe_audio(whisper_model, audio_path: str) -> str:
-    """Transcribe an audio file using Whisper.
 
-    Returns the transcribed text, or empty string on failure.
-    """
+def _wav_duration(path: Path) -> float:
+    """Length of a WAV file in seconds (0 if missing or unreadable)."""
     try:
-        result = whisper_model.transcribe(audio_path)
-        return (result.get("text") or "").strip()
-    except Exception as e:
-        logger.warning(f"Whisper transcription failed: {e}")
-        return ""
+        with wave.open(str(path), "rb") as w:
+            return w.getnframes() / (w.getframerate() or 1)
+    except (FileNotFoundError, EOFError, wave.Error):
+        return 0.0
 
 
-def extract_video_frames(video_path: str | Path, interval: float = FRAME_INTERVAL_SECS) -> list[str]:
-    """Extract frames from a video at regular intervals.
+def _dhash(gray: bytes) -> int:
+    """64-bit difference hash of a 9x8 grayscale thumbnail.
 
-    Returns list of paths to temporary frame image files.
-    The caller is responsible for cleaning up the temp files.
+    One bit per horizontally adjacent pixel pair: set if brightness
+    increases left to right.
     """
-    import cv2
+    h = 0
+    for row in range(0, 72, 9):
+        for col in range(row, row + 8):
+            h = (h << 1) | (gray[col + 1] > gray[col])
+    return h
 
-    video_path = str(video_path)
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
-        return []
 
-    fps = cap.get(cv2.CAP_PROP_FPS) or 30
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    duration = total_frames / fps if fps > 0 else 0
+def _drop_similar_frames(frame_paths: list[str], hashes: bytes) -> list[str]:
+    """Remove frames that look like the last kept one; return the rest.
+
+    hashes holds one 9x8 grayscale thumbnail (72 bytes) per frame, in frame
+    order. Without a thumbnail for every frame all frames are kept.
+    """
+    if len(hashes) != 72 * len(frame_paths):
+        return frame_paths
+    kept = []
+    last = None
+    for i, path in enumerate(frame_paths):
+        h = _dhash(hashes[72 * i:72 * (i + 1)])
+        if last is not None and bin(h ^ last).count("1") <= FRAME_DHASH_MAX_DISTANCE:
+            Path(path).unlink(missing_ok=True)
+            continue
+        kept.append(path)
+        last = h
+    return kept
+
+
+def decode_video(
+    video_path: str | Path,
+    out_dir: str | Path,
+    extract_audio: bool = True,
+    extract_frames: bool = True,
+    interval: float = FRAME_INTERVAL_SECS,
+    probe: dict | None = None,
+) -> tuple[str | None, list[str]] | None:
+    """Extract the audio track and sampled frames in a single ffmpeg pass.
+
+    The video is decoded once, sequentially: audio goes to a 16kHz mono WAV
+    (what Whisper expects) and one frame every `interval` seconds to JPEGs,
+    both inside out_dir. Streams the file doesn't have are skipped.
+
+    Silence is cut from the audio; if less than MIN_SPEECH_SECS remains
+    (silent or near-silent clip), no audio path is returned. Frames nearly
+    identical to the previously kept one are dropped (see _dhash()).
+
+    Returns (wav_path or None, frame_paths), or None if ffmpeg failed or
+    timed out (logged with its stderr).
+    """
+    video_path = Path(video_path)
+    out_dir = Path(out_dir)
+    if probe is None:
+        probe = probe_video(video_path)
+    want_audio = extract_audio and probe["has_audio"]
+    want_frames = extract_frames and probe["has_video"]
+    if not (want_audio or want_frames):
+        return None, []
+
+    wav_path = out_dir / "audio.wav"
+    thumbs_path = out_dir / "thumbs.gray"
+    cmd = ["ffmpeg", "-y", "-v", "error", "-i", str(video_path)]
+    if want_audio:
+        cmd += [
+            "-map", "0:a:0",
+            "-af", (
+                f"silenceremove=start_periods=1:start_threshold={SILENCE_THRESHOLD_DB}dB"
+                f":stop_periods=-1:stop_duration=1:stop_threshold={SILENCE_THRESHOLD_DB}dB"
+            ),
+            "-acodec", "pcm_s16le",  # 16-bit PCM
+            "-ar", "16000",          # 16kHz (Whisper's expected rate)
+            "-ac", "1",              # Mono
+            str(wav_path),
+        ]
+    if want_frames:
+        # First frame, then the first frame at least `interval` after the
+        # previously kept one (0s, 3s, 6s, ...), matching the old seek loop;
+        # kept frames are scaled to fit OCR_MAX_DIMENSION (never upscaled)
+        # and, alongside, to a 9x8 grayscale thumbnail for _dhash()
+        cmd += [
+            "-filter_complex", (
+                f"[0:v:0]select='isnan(prev_selected_t)+gte(t-prev_selected_t,{interval:g})',"
+                "split=2[full][small];"
+                f"[full]scale=w='min({OCR_MAX_DIMENSION},iw)':h='min({OCR_MAX_DIMENSION},ih)'"
+                ":force_original_aspect_ratio=decrease:flags=area[ocr];"
+                "[small]scale=9:8:flags=area,format=gray[thumb]"
+            ),
+            "-map", "[ocr]",
+            "-fps_mode", "vfr",
+            "-q:v", "3",
+            str(out_dir / "frame_%04d.jpg"),
+            "-map", "[thumb]",
+            "-fps_mode", "vfr",
+            "-f", "rawvideo",
+            str(thumbs_path),
+        ]
 
-    # Calculate which frames to extract
-    frame_interval = int(fps * interval)
-    if frame_interval < 1:
-        frame_interval = 1
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=120)
+    except subprocess.TimeoutExpired:
+        logger.warning(f"ffmpeg timed out decoding {video_path}")
+        return None
+    except FileNotFoundError:
+        logger.warning("ffmpeg not found on PATH")
+        return None
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        logger.warning(f"ffmpeg failed on {video_path} (exit {result.returncode}): {stderr}")
+        return None
 
+    audio_path = None
+    # Skip Whisper for clips with (almost) nothing left after silence removal
+    if want_audio and _wav_duration(wav_path) >= MIN_SPEECH_SECS:
+        audio_path = str(wav_path)
     frame_paths = []
-    frame_idx = 0
+    if want_frames:
+        frame_paths = sorted(str(p) for p in out_dir.glob("frame_*.jpg"))
+        try:
+            frame_paths = _drop_similar_frames(frame_paths, thumbs_path.read_bytes())
+        except FileNotFoundError:
+            pass
+    return audio_path, frame_paths
 
-    while True:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-        ret, frame = cap.read()
-        if not ret:
-            break
 
-        tmp = tempfile.NamedTemporaryFile(suffix=".jpg", delete=False)
-        tmp.close()
-        cv2.imwrite(tmp.name, frame)
-        frame_paths.append(tmp.name)
+def _transcribe_greedy(whisper_model, audio_path: str) -> dict:
+    """Run lightning-whisper-mlx with WHISPER_DECODE_OPTIONS.
+
+    LightningWhisperMLX.transcribe() only forwards `language`, so call the
+    underlying transcribe_audio() with the same model path and batch size
+    the wrapper uses. Falls back to the wrapper if that API isn't there.
+    The mlx-whisper adapter applies the options itself.
+    """
+    if isinstance(whisper_model, _MlxWhisper):
+        return whisper_model.transcribe(audio_path)
+    try:
+        from lightning_whisper_mlx.transcribe import transcribe_audio as lightning_transcribe
+    except ImportError:
+        return whisper_model.transcribe(audio_path)
+    try:
+        return lightning_transcribe(
+            audio_path,
+            path_or_hf_repo=f"./mlx_models/{whisper_model.name}",
+            batch_size=whisper_model.batch_size,
+            **WHISPER_DECODE_OPTIONS,
+        )
+    except TypeError:
+        # Signature changed in a newer release — use the plain wrapper
+        return whisper_model.transcribe(audio_path)
+
+
+def _file_digest(path: str | Path) -> str:
+    """Hex blake2b digest of a file's contents (cache key)."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _media_cache(kind: str) -> FileCache:
+    return FileCache(config.CACHE_DIR / kind, ttl=MEDIA_CACHE_TTL)
+
+
+def transcribe_audio(whisper_model, audio_path: str) -> str:
+    """Transcribe an audio file using Whisper.
+
+    Transcripts are cached per model and audio content. Returns the
+    transcribed text, or empty string on failure.
+    """
+    try:
+        cache = _media_cache("whisper")
+        key = f"{whisper_model.name}-{_file_digest(audio_path)}"
+        text = cache.get(key)
+        if text is None:
+            result = _transcribe_greedy(whisper_model, audio_path)
+            text = (result.get("text") or "").strip()
+            cache.set(key, text)
+        return text
+    except Exception as e:
+        logger.warning(f"Whisper transcription failed: {e}")
+        return ""
 
-        frame_idx += frame_interval
-        if frame_idx >= total_frames:
-            break
 
-    cap.release()
-    return frame_paths
+def _load_for_ocr(image_path: str | Path):
+    """Open an image for OCR, scaled down to OCR_MAX_DIMENSION if larger.
+
+    The original file is left untouched. Returns the path itself if it
+    needs no scaling or Pillow (an ocrmac dependency) isn't available.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return str(image_path)
+
+    with Image.open(image_path) as img:
+        if max(img.size) <= OCR_MAX_DIMENSION:
+            return str(image_path)
+        img.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION), Image.Resampling.BOX)
+        # A detached copy, so the source file is closed on return
+        return img.copy()
 
 
 def ocr_image(image_path: str | Path) -> list[tuple[str, float]]:
     """Run OCR on a single image using macOS Vision framework.
 
-    Returns list of (text, confidence) tuples.
+    Raw recognitions are cached by image content, so the confidence and
+    length filters still apply to cached results. Returns list of
+    (text, confidence) tuples.
     """
-    from ocrmac.ocrmac import OCR
-
     try:
-        result = OCR(str(image_path), recognition_level="accurate")
-        annotations = result.recognize()
+        cache = _media_cache("ocr")
+        key = _file_digest(image_path)
+        annotations = cache.get(key)
+        if annotations is None:
+            from ocrmac.ocrmac import OCR
+
+            result = OCR(_load_for_ocr(image_path), recognition_level="accurate")
+            annotations = [(text, conf) for text, conf, _bbox in result.recognize()]
+            cache.set(key, annotations)
         return [
             (text, conf)
-            for text, conf, _bbox in annotations
+            for text, conf in annotations
             if conf >= MIN_OCR_CONFIDENCE and len(text.strip()) >= MIN_TEXT_LENGTH
         ]
     except Exception as e:
@@ -172,73 +442,183 @@ def ocr_image(image_path: str | Path) -> list[tuple[str, float]]:
         return []
 
 
-def deduplicate_ocr_texts(texts: list[tuple[str, float]]) -> list[str]:
+def ocr_batch(paths: list[str], executor: Executor | None = None) -> list[list[tuple[str, float]]]:
+    """OCR several images, in parallel when an executor is given.
+
+    Returns one ocr_image() result per path, in order. The confidence and
+    length filters run in the workers, so only kept text crosses processes.
+    """
+    if executor is None or len(paths) < 2:
+        return [ocr_image(p) for p in paths]
+    return list(executor.map(ocr_image, paths))
+
+
+def deduplicate_ocr_texts(texts: list[tuple[str, float]], sort: bool = False) -> list[str]:
     """Deduplicate OCR results across multiple frames/images.
 
     Video frames often contain the same text across many consecutive frames.
-    This normalizes and deduplicates while preserving the highest-confidence version.
+    Texts are compared case-insensitively with punctuation and whitespace
+    collapsed, keeping the highest-confidence original. A text whose words
+    all appear, in order, inside a longer kept text (a headline read once
+    with and once without its last line) is dropped as well.
+
+    Args:
+        texts: (text, confidence) pairs.
+        sort: Order by confidence, highest first. Otherwise texts keep the
+            order they were first seen in (frame order for videos).
     """
-    seen: dict[str, tuple[str, float]] = {}  # normalized -> (original, confidence)
+    seen: dict[str, list] = {}  # normalized -> [original, confidence]
 
     for text, conf in texts:
-        normalized = text.strip().lower()
+        normalized = _OCR_NOISE_RE.sub(" ", text).strip().lower()
         if not normalized:
             continue
-        if normalized not in seen or conf > seen[normalized][1]:
-            seen[normalized] = (text.strip(), conf)
+        best = seen.get(normalized)
+        if best is None:
+            seen[normalized] = [text.strip(), conf]
+        elif conf > best[1]:
+            best[0] = text.strip()
+            best[1] = conf
+
+    # Longest first, so each text only needs checking against texts kept
+    # before it. A containing text has every word of the candidate, so only
+    # the kept texts sharing the candidate's rarest word are compared.
+    kept: list[str] = []
+    by_word: dict[str, list[str]] = {}
+    for normalized in sorted(seen, key=len, reverse=True):
+        padded = f" {normalized} "
+        words = set(normalized.split())
+        candidates = min((by_word.get(w, ()) for w in words), key=len)
+        if any(padded in k for k in candidates):
+            continue
+        kept.append(padded)
+        for w in words:
+            by_word.setdefault(w, []).append(padded)
+    if len(kept) < len(seen):
+        kept_set = {k[1:-1] for k in kept}
+        seen = {n: v for n, v in seen.items() if n in kept_set}
 
-    # Sort by confidence descending, return original (non-normalized) texts
-    sorted_texts = sorted(seen.values(), key=lambda x: x[1], reverse=True)
-    return [t for t, _c in sorted_texts]
+    if sort:
+        return [t for t, _c in sorted(seen.values(), key=lambda x: x[1], reverse=True)]
+    return [t for t, _c in seen.values()]
 
 
-def process_video(
+def prepare_video(
     video_path: str | Path,
-    whisper_model,
+    extract_audio: bool = True,
+    extract_frames: bool = True,
+    work_dir: str | Path | None = None,
 ) -> dict:
-    """Process a single video file: transcribe audio + OCR frames.
+    """Run the decoding side of video processing: audio track, frames, duration.
+
+    Split from finalize_video() so all of a post's videos can be decoded
+    before their audio is transcribed back to back.
+
+    Output goes to work_dir if given (the caller removes it), otherwise to
+    a new temp dir that finalize_video() removes.
 
     Returns dict with:
-        audio_transcript: str
-        ocr_texts: list[str]
+        audio_path: str | None
+        frame_paths: list[str]
         duration_secs: float
+        tmp_dir: str | None (temp dir owned by this video, if any)
+        decode_failed: bool (ffmpeg failed; audio_path and frame_paths are empty)
     """
-    import cv2
-
     video_path = Path(video_path)
-    result = {"audio_transcript": "", "ocr_texts": [], "duration_secs": 0.0}
+    prepared = {
+        "audio_path": None, "frame_paths": [], "duration_secs": 0.0, "tmp_dir": None,
+        "decode_failed": False,
+    }
 
     if not video_path.exists():
-        return result
-
-    # Get video duration
-    cap = cv2.VideoCapture(str(video_path))
-    if cap.isOpened():
-        fps = cap.get(cv2.CAP_PROP_FPS) or 30
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        result["duration_secs"] = round(total_frames / fps, 1) if fps > 0 else 0
-        cap.release()
-
-    # Audio transcription
-    audio_path = extract_audio_from_video(video_path)
-    if audio_path:
-        try:
-            result["audio_transcript"] = transcribe_audio(whisper_model, audio_path)
-        finally:
-            Path(audio_path).unlink(missing_ok=True)
+        return prepared
+
+    probe = probe_video(video_path)
+    prepared["duration_secs"] = probe["duration_secs"]
+
+    if extract_audio or extract_frames:
+        if work_dir is None:
+            work_dir = prepared["tmp_dir"] = tempfile.mkdtemp(prefix="socmed_video_")
+        decoded = decode_video(
+            video_path, work_dir,
+            extract_audio=extract_audio,
+            extract_frames=extract_frames,
+            probe=probe,
+        )
+        if decoded is None:
+            prepared["decode_failed"] = True
+        else:
+            prepared["audio_path"], prepared["frame_paths"] = decoded
+    return prepared
+
+
+def transcribe_batch(whisper_model, audio_paths: list[str | None]) -> list[str]:
+    """Transcribe several prepared audio files in one go.
+
+    Returns one transcript per path, in order ("" for None paths or when
+    no model is loaded). lightning-whisper-mlx takes a single file per
+    call, so the files are fed back to back; its batch_size batches the
+    30-second windows within each file.
+    """
+    if whisper_model is None:
+        return ["" for _ in audio_paths]
+    return [transcribe_audio(whisper_model, path) if path else "" for path in audio_paths]
+
+
+def cleanup_video(prepared: dict) -> None:
+    """Remove a prepared video's temporary audio and frames (idempotent)."""
+    if prepared["tmp_dir"]:
+        shutil.rmtree(prepared["tmp_dir"], ignore_errors=True)
 
-    # Frame OCR
-    frame_paths = extract_video_frames(video_path)
+
+def finalize_video(
+    prepared: dict,
+    transcript: str = "",
+    frame_ocr: list[tuple[str, float]] | None = None,
+) -> dict:
+    """OCR a prepared video's frames, attach its transcript, and clean up.
+
+    Pass frame_ocr if the frames were already OCR'd (e.g. via ocr_batch).
+
+    Returns dict with:
+        audio_transcript: str
+        ocr_texts: list[str]
+        duration_secs: float
+    """
     all_ocr: list[tuple[str, float]] = []
     try:
-        for fp in frame_paths:
-            all_ocr.extend(ocr_image(fp))
+        if frame_ocr is not None:
+            all_ocr = frame_ocr
+        else:
+            for fp in prepared["frame_paths"]:
+                all_ocr.extend(ocr_image(fp))
     finally:
-        for fp in frame_paths:
-            Path(fp).unlink(missing_ok=True)
+        cleanup_video(prepared)
+
+    return {
+        "audio_transcript": transcript,
+        "ocr_texts": deduplicate_ocr_texts(all_ocr, sort=True),
+        "duration_secs": prepared["duration_secs"],
+    }
 
-    result["ocr_texts"] = deduplicate_ocr_texts(all_ocr)
-    return result
+
+def process_video(
+    video_path: str | Path,
+    whisper_model,
+) -> dict:
+    """Process a single video file: transcribe audio + OCR frames.
+
+    Returns dict with:
+        audio_transcript: str
+        ocr_texts: list[str]
+        duration_secs: float
+    """
+    with tempfile.TemporaryDirectory(prefix="socmed_video_") as work_dir:
+        prepared = prepare_video(
+            video_path, extract_audio=whisper_model is not None, work_dir=work_dir
+        )
+        [transcript] = transcribe_batch(whisper_model, [prepared["audio_path"]])
+        return finalize_video(prepared, transcript)
 
 
 def process_image(image_path: str | Path) -> dict:
@@ -252,7 +632,85 @@ def process_image(image_path: str | Path) -> dict:
         return {"ocr_texts": []}
 
     raw = ocr_image(image_path)
-    return {"ocr_texts": deduplicate_ocr_texts(raw)}
+    return {"ocr_texts": deduplicate_ocr_texts(raw, sort=True)}
+
+
+def _prepare_post(post: dict, extract_audio: bool, ocr: bool) -> dict:
+    """Decode a post's videos ahead of transcription and OCR.
+
+    Everything is written under one temp dir per post, so the consumer
+    cleans up with a single rmtree.
+
+    Returns dict with:
+        tmp_dir: str
+        parts: list of (prepared video or None for an image, paths to OCR),
+            in media order
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="socmed_post_")
+    parts: list[tuple[dict | None, list[str]]] = []
+    try:
+        for m in post.get("media", []):
+            local_path = m.get("local_path")
+            if not local_path or not Path(local_path).exists():
+                continue
+
+            if m.get("media_type") == "video":
+                work_dir = Path(tmp_dir) / f"video_{len(parts)}"
+                work_dir.mkdir()
+                prepared = prepare_video(
+                    local_path,
+                    extract_audio=extract_audio,
+                    extract_frames=ocr,
+                    work_dir=work_dir,
+                )
+                parts.append((prepared, prepared["frame_paths"]))
+
+            elif m.get("media_type") == "image" and ocr:
+                parts.append((None, [local_path]))
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return {"tmp_dir": tmp_dir, "parts": parts}
+
+
+def _extract_post(prepared_post: dict, whisper_model, ocr_pool: Executor | None) -> dict:
+    """Transcribe and OCR a post prepared by _prepare_post().
+
+    Returns dict with audio_transcripts, ocr_texts (deduplicated across the
+    post's media), images_ocrd, audio_secs (duration of transcribed videos),
+    and decode_failed (any of the post's videos failed to decode).
+    """
+    parts = prepared_post["parts"]
+
+    # Transcribe all of the post's videos back to back, then OCR every
+    # image and sampled frame of the post in one batch
+    videos = [prepared for prepared, _ in parts if prepared is not None]
+    transcripts = iter(transcribe_batch(whisper_model, [v["audio_path"] for v in videos]))
+    ocr_results = iter(ocr_batch([p for _, paths in parts for p in paths], ocr_pool))
+
+    result = {
+        "audio_transcripts": [], "ocr_texts": [], "images_ocrd": 0, "audio_secs": 0.0,
+        "decode_failed": any(v["decode_failed"] for v in videos),
+    }
+    post_ocr_all: list[tuple[str, float]] = []
+    for prepared, paths in parts:
+        raw = [item for _ in paths for item in next(ocr_results)]
+        if prepared is None:
+            post_ocr_all.extend(raw)
+            result["images_ocrd"] += 1
+            continue
+
+        # Frame OCR goes straight into the post-wide dedup below (with its
+        # real confidences) rather than being deduplicated per video first
+        post_ocr_all.extend(raw)
+        vid_result = finalize_video(prepared, next(transcripts), frame_ocr=[])
+        if vid_result["audio_transcript"]:
+            result["audio_transcripts"].append(vid_result["audio_transcript"])
+            result["audio_secs"] += vid_result["duration_secs"]
+
+    # Deduplicate OCR across all media items in this post
+    result["ocr_texts"] = deduplicate_ocr_texts(post_ocr_all, sort=True)
+    return result
 
 
 def get_extractable_posts(
@@ -262,15 +720,22 @@ def get_extractable_posts(
     """Find posts that have local media but no extraction yet.
 
     Only returns posts where at least one media item has a local_path.
-    Skips posts that already have an `extracted_text` field.
+    Skips posts that already have an `extracted_text` field, except those
+    whose video failed to decode fewer than MAX_DECODE_ATTEMPTS times.
     """
-    store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
-    posts = store.read()
+    store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
     candidates = []
 
-    for post in posts:
-        # Skip if already extracted
-        if post.get("extracted_text"):
+    needle = collection.lower() if collection else None
+
+    # Streamed, so posts that are filtered out are never all held at once
+    for post in store.iter_items():
+        # Skip if already extracted (decode failures get another try)
+        et = post.get("extracted_text")
+        if et and not (
+            et.get("extraction_status") == DECODE_FAILED_STATUS
+            and et.get("decode_attempts", 1) < MAX_DECODE_ATTEMPTS
+        ):
             continue
 
         # Must have at least one local media file
@@ -279,10 +744,8 @@ def get_extractable_posts(
             continue
 
         # Collection filter
-        if collection:
-            post_cols = post.get("collections", [])
-            if not any(collection.lower() in c.lower() for c in post_cols):
-                continue
+        if needle and not any(needle in c.lower() for c in post.get("collections", [])):
+            continue
 
         candidates.append(post)
         if limit and len(candidates) >= limit:
@@ -297,6 +760,7 @@ def run_extraction(
     save_every: int = 10,
     skip_whisper: bool = False,
     skip_ocr: bool = False,
+    whisper_model_name: str = WHISPER_MODEL,
 ):
     """Run the full extraction pipeline.
 
@@ -306,7 +770,14 @@ def run_extraction(
         save_every: Save progress every N posts.
         skip_whisper: Skip audio transcription (OCR only).
         skip_ocr: Skip OCR (audio only).
+        whisper_model_name: lightning-whisper-mlx model (e.g. large-v3,
+            distil-large-v3 for English-only content).
     """
+    # Extracted posts are never looked up again, so expired OCR/Whisper
+    # entries are only removed by sweeping the cache directories
+    for kind in ("ocr", "whisper"):
+        _media_cache(kind).prune()
+
     candidates = get_extractable_posts(collection=collection, limit=limit)
     if not candidates:
         print("No posts need text extraction.")
@@ -316,37 +787,47 @@ def run_extraction(
     print(f"Found {len(candidates)} posts{col_str} needing extraction")
 
     # Count media types
-    n_videos = sum(
-        1 for p in candidates
+    media_types = Counter(
+        m.get("media_type")
+        for p in candidates
         for m in p.get("media", [])
-        if m.get("media_type") == "video" and m.get("local_path")
-    )
-    n_images = sum(
-        1 for p in candidates
-        for m in p.get("media", [])
-        if m.get("media_type") == "image" and m.get("local_path")
+        if m.get("local_path")
     )
+    n_videos = media_types["video"]
+    n_images = media_types["image"]
     print(f"  Videos to process: {n_videos}")
     print(f"  Images to process: {n_images}")
 
-    # Load Whisper model once (expensive — ~10-15s)
+    # Whisper is loaded on the first post that actually has audio left after
+    # decoding (expensive — ~10-15s, ~3GB), so runs where every video turns
+    # out silent or undecodable never pay for it
+    transcribe = not skip_whisper and n_videos > 0
     whisper_model = None
-    if not skip_whisper and n_videos > 0:
-        print("\nLoading Whisper large-v3 model...")
-        t0 = time.time()
-        whisper_model = _load_whisper()
-        print(f"Model loaded in {time.time() - t0:.1f}s")
-    elif skip_whisper:
+    if skip_whisper:
         print("\nSkipping audio transcription (--skip-whisper)")
 
+    def get_whisper():
+        nonlocal whisper_model
+        if whisper_model is None:
+            print(f"\nLoading Whisper {whisper_model_name} model...")
+            t0 = time.time()
+            whisper_model = _load_whisper(whisper_model_name)
+            _warm_up_whisper(whisper_model)
+            print(f"Model loaded in {time.time() - t0:.1f}s")
+        return whisper_model
+
+    ocr_pool = None
     if skip_ocr:
         print("Skipping OCR (--skip-ocr)")
+    elif OCR_CONCURRENCY > 1:
+        ocr_pool = ProcessPoolExecutor(max_workers=OCR_CONCURRENCY)
+        print(f"OCR workers: {OCR_CONCURRENCY}")
 
     print()
 
     # Use patch_items for concurrent-safe writes — only updates extracted_text
     # field, never clobbering enrichment data written by browser_enricher.
-    store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
+    store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
     pending_patches: dict[str, dict] = {}
 
     processed = 0
@@ -355,76 +836,117 @@ def run_extraction(
     total_audio_secs = 0
     start_time = time.time()
 
-    for ci, candidate in enumerate(candidates):
-        post_id = candidate["id"]
-
-        extraction = {
-            "audio_transcripts": [],
-            "ocr_texts": [],
-            "extracted_at": datetime.now(timezone.utc).isoformat(),
-            "extraction_status": "complete",
-        }
+    # Decode the next posts (ffmpeg) in a background thread while the
+    # current one is transcribed and OCR'd. The queue bound limits how
+    # many decoded posts wait on disk.
+    prepared_queue: queue.Queue = queue.Queue(maxsize=2)
+    stop = threading.Event()
 
-        post_ocr_all: list[tuple[str, float]] = []
+    def produce() -> None:
+        try:
+            for candidate in candidates:
+                if stop.is_set():
+                    break
+                prepared_queue.put((candidate, _prepare_post(
+                    candidate, extract_audio=transcribe, ocr=not skip_ocr,
+                )))
+        except Exception as e:
+            prepared_queue.put(e)
+        finally:
+            prepared_queue.put(None)
 
-        for m in candidate.get("media", []):
-            local_path = m.get("local_path")
-            if not local_path or not Path(local_path).exists():
-                continue
+    producer = threading.Thread(target=produce, name="extract-decode", daemon=True)
+    producer.start()
+    producer_done = False
 
-            if m.get("media_type") == "video":
-                vid_result = process_video(
-                    local_path,
-                    whisper_model=whisper_model,
+    try:
+        for ci in range(len(candidates)):
+            item = prepared_queue.get()
+            if item is None:
+                producer_done = True
+                break
+            if isinstance(item, Exception):
+                raise item
+            candidate, prepared_post = item
+            post_id = candidate["id"]
+
+            has_audio = any(
+                prepared is not None and prepared["audio_path"]
+                for prepared, _ in prepared_post["parts"]
+            )
+            try:
+                post_result = _extract_post(
+                    prepared_post, get_whisper() if has_audio else None, ocr_pool,
                 )
-                if vid_result["audio_transcript"] and not skip_whisper:
-                    extraction["audio_transcripts"].append(vid_result["audio_transcript"])
-                    videos_transcribed += 1
-                    total_audio_secs += vid_result["duration_secs"]
-
-                if not skip_ocr:
-                    # Collect raw OCR for dedup across all media
-                    for t in vid_result["ocr_texts"]:
-                        post_ocr_all.append((t, 1.0))
-
-            elif m.get("media_type") == "image":
-                if not skip_ocr:
-                    raw = ocr_image(local_path)
-                    post_ocr_all.extend(raw)
-                    images_ocrd += 1
-
-        # Deduplicate OCR across all media items in this post
-        extraction["ocr_texts"] = deduplicate_ocr_texts(post_ocr_all)
-
-        # Mark as partial if we skipped something
-        if skip_whisper and n_videos > 0:
-            extraction["extraction_status"] = "partial:no_audio"
-        if skip_ocr:
-            extraction["extraction_status"] = "partial:no_ocr"
-
-        pending_patches[post_id] = {"extracted_text": extraction}
-        processed += 1
-
-        # Progress indicator
-        has_audio = bool(extraction["audio_transcripts"])
-        has_ocr = bool(extraction["ocr_texts"])
-        indicator = "A" if has_audio and has_ocr else "a" if has_audio else "T" if has_ocr else "."
-        sys.stdout.write(indicator)
-        sys.stdout.flush()
-
-        # Periodic save — merge only extracted_text into current file
-        if processed % save_every == 0 or ci == len(candidates) - 1:
+            finally:
+                shutil.rmtree(prepared_post["tmp_dir"], ignore_errors=True)
+
+            extraction = {
+                "audio_transcripts": post_result["audio_transcripts"],
+                "ocr_texts": post_result["ocr_texts"],
+                "extracted_at": datetime.now(timezone.utc).isoformat(),
+                "extraction_status": "complete",
+            }
+            if extraction["audio_transcripts"]:
+                videos_transcribed += len(extraction["audio_transcripts"])
+                total_audio_secs += post_result["audio_secs"]
+            images_ocrd += post_result["images_ocrd"]
+
+            # Mark as partial if we skipped something
+            if skip_whisper and n_videos > 0:
+                extraction["extraction_status"] = "partial:no_audio"
+            if skip_ocr:
+                extraction["extraction_status"] = "partial:no_ocr"
+            if post_result["decode_failed"]:
+                # Counted across runs so a broken file isn't retried forever
+                previous = candidate.get("extracted_text") or {}
+                attempts = previous.get("decode_attempts", 1) if (
+                    previous.get("extraction_status") == DECODE_FAILED_STATUS
+                ) else 0
+                extraction["extraction_status"] = DECODE_FAILED_STATUS
+                extraction["decode_attempts"] = attempts + 1
+
+            pending_patches[post_id] = {"extracted_text": extraction}
+            processed += 1
+
+            # Progress indicator
+            has_audio = bool(extraction["audio_transcripts"])
+            has_ocr = bool(extraction["ocr_texts"])
+            indicator = "A" if has_audio and has_ocr else "a" if has_audio else "T" if has_ocr else "."
+            sys.stdout.write(indicator)
+            sys.stdout.flush()
+
+            # Periodic save — journals only extracted_text, so the cost is
+            # per patched post, not a rewrite of saved_posts.json
+            if processed % save_every == 0 or ci == len(candidates) - 1:
+                store.patch_items(pending_patches)
+                pending_patches.clear()
+                elapsed = time.time() - start_time
+                rate = processed / elapsed * 60 if elapsed > 0 else 0
+                remaining = len(candidates) - (ci + 1)
+                eta = remaining / (rate / 60) if rate > 0 else 0
+                print(f" [{ci+1}/{len(candidates)}] "
+                      f"{videos_transcribed} transcribed, "
+                      f"{images_ocrd} OCR'd | "
+                      f"{rate:.1f}/min | "
+                      f"ETA: {eta/60:.1f}min")
+    finally:
+        # Keep finished posts when the run is interrupted or fails midway
+        if pending_patches:
             store.patch_items(pending_patches)
             pending_patches.clear()
-            elapsed = time.time() - start_time
-            rate = processed / elapsed * 60 if elapsed > 0 else 0
-            remaining = len(candidates) - (ci + 1)
-            eta = remaining / (rate / 60) if rate > 0 else 0
-            print(f" [{ci+1}/{len(candidates)}] "
-                  f"{videos_transcribed} transcribed, "
-                  f"{images_ocrd} OCR'd | "
-                  f"{rate:.1f}/min | "
-                  f"ETA: {eta/60:.1f}min")
+        # Stop decoding ahead and discard what was already decoded
+        stop.set()
+        while not producer_done:
+            item = prepared_queue.get()
+            if item is None:
+                producer_done = True
+            elif isinstance(item, tuple):
+                shutil.rmtree(item[1]["tmp_dir"], ignore_errors=True)
+        producer.join()
+        # Also on failure, so the OCR worker processes don't outlive the run
+        if ocr_pool is not None:
+            ocr_pool.shutdown(cancel_futures=True)
 
     elapsed = time.time() - start_time
     print(f"\n{'='*50}")
@@ -434,40 +956,54 @@ def run_extraction(
     print(f"  Images OCR'd: {images_ocrd}")
 
     # Summary of content found (re-read file for accurate counts)
-    all_posts = store.read()
-    total_transcripts = sum(
-        len(p.get("extracted_text", {}).get("audio_transcripts", []))
-        for p in all_posts if p.get("extracted_text")
-    )
-    total_ocr = sum(
-        len(p.get("extracted_text", {}).get("ocr_texts", []))
-        for p in all_posts if p.get("extracted_text")
-    )
+    total_transcripts = 0
+    total_ocr = 0
+    for p in store.read():
+        et = p.get("extracted_text")
+        if et:
+            total_transcripts += len(et.get("audio_transcripts", []))
+            total_ocr += len(et.get("ocr_texts", []))
     print(f"  Total audio transcripts: {total_transcripts}")
     print(f"  Total unique OCR texts: {total_ocr}")
 
 
 def show_stats():
     """Show extraction statistics."""
-    store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
+    store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
     posts = store.read()
 
-    total = len(posts)
-    with_extraction = sum(1 for p in posts if p.get("extracted_text"))
-    with_audio = sum(
-        1 for p in posts
-        if p.get("extracted_text", {}).get("audio_transcripts")
-    )
-    with_ocr = sum(
-        1 for p in posts
-        if p.get("extracted_text", {}).get("ocr_texts")
-    )
+    # One pass over the posts for both the totals and the per-collection
+    # breakdown
+    counts = Counter()
+    collections: dict[str, Counter] = {}
+    for p in posts:
+        et = p.get("extracted_text")
+        has_local = any(m.get("local_path") for m in p.get("media", []))
+        if et:
+            counts["extracted"] += 1
+            if et.get("audio_transcripts"):
+                counts["audio"] += 1
+            if et.get("ocr_texts"):
+                counts["ocr"] += 1
+        if has_local:
+            counts["local_media"] += 1
+
+        for c in p.get("collections", []):
+            col = collections.get(c)
+            if col is None:
+                col = collections[c] = Counter()
+            col["total"] += 1
+            if et:
+                col["extracted"] += 1
+            elif has_local:
+                col["pending"] += 1
 
+    total = len(posts)
+    with_extraction = counts["extracted"]
+    with_audio = counts["audio"]
+    with_ocr = counts["ocr"]
+    with_local_media = counts["local_media"]
     # How many still need extraction
-    with_local_media = sum(
-        1 for p in posts
-        if any(m.get("local_path") for m in p.get("media", []))
-    )
     pending = with_local_media - with_extraction
 
     print(f"Total posts:           {total}")
@@ -477,29 +1013,17 @@ def show_stats():
     print(f"  With OCR text:       {with_ocr}")
     print(f"Pending extraction:    {pending}")
 
-    # Collection breakdown
-    collections: dict[str, dict] = {}
-    for p in posts:
-        for c in p.get("collections", []):
-            if c not in collections:
-                collections[c] = {"total": 0, "extracted": 0, "pending": 0}
-            collections[c]["total"] += 1
-            if p.get("extracted_text"):
-                collections[c]["extracted"] += 1
-            elif any(m.get("local_path") for m in p.get("media", [])):
-                collections[c]["pending"] += 1
-
     if collections:
         print(f"\nBy collection (top 15):")
         sorted_cols = sorted(collections.items(), key=lambda x: x[1]["pending"], reverse=True)
-        for name, counts in sorted_cols[:15]:
-            print(f"  {name}: {counts['extracted']}/{counts['total']} extracted, "
-                  f"{counts['pending']} pending")
+        for name, col_counts in sorted_cols[:15]:
+            print(f"  {name}: {col_counts['extracted']}/{col_counts['total']} extracted, "
+                  f"{col_counts['pending']} pending")
 
 
 def show_sample(post_id: str | None = None, collection: str | None = None):
     """Show extraction results for a specific post or random extracted post."""
-    store = JsonStore(DATA_FILES["instagram"]["saved_posts"])
+    store = JsonStore(config.DATA_FILES["instagram"]["saved_posts"])
     posts = store.read()
 
     target = None
@@ -577,6 +1101,9 @@ def main():
                             help="Skip audio transcription (OCR only)")
     run_parser.add_argument("--skip-ocr", action="store_true",
                             help="Skip OCR (audio transcription only)")
+    run_parser.add_argument("--whisper-model", type=str, default=WHISPER_MODEL,
+                            help=f"Whisper model (default: {WHISPER_MODEL}; "
+                                 "distil-large-v3 is faster but English-only)")
 
     sub.add_parser("stats", help="Show extraction statistics")
 
@@ -589,12 +1116,16 @@ def main():
     args = parser.parse_args()
 
     if args.command == "run":
+        # Turn SIGTERM (e.g. a killed background task) into SystemExit so
+        # run_extraction's cleanup saves the posts finished so far
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
         run_extraction(
             collection=args.collection,
             limit=args.limit,
             save_every=args.save_every,
             skip_whisper=args.skip_whisper,
             skip_ocr=args.skip_ocr,
+            whisper_model_name=args.whisper_model,
         )
     elif args.command == "stats":
         show_stats()
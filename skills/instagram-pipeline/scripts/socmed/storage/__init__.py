@@ -1,6 +1,7 @@
 """Storage layer for social media data."""
 
+from socmed.storage.file_cache import FileCache
 from socmed.storage.json_store import JsonStore
 from socmed.storage.sync_tracker import SyncTracker
 
-__all__ = ["JsonStore", "SyncTracker"]
+__all__ = ["FileCache", "JsonStore", "SyncTracker"]
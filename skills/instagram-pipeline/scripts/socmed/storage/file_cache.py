@@ -0,0 +1,81 @@
+"""Small on-disk TTL cache of JSON values, one file per key.
+
+Survives restarts, so a crashed run or a follow-up pipeline can reuse
+recent API responses instead of asking the server again. Entries expire
+by file mtime; expired files are removed lazily on lookup or by prune().
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from socmed.utils import jsonio
+
+_UNSAFE_KEY_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class FileCache:
+    """Directory-backed key/value cache with a fixed time-to-live.
+
+    Args:
+        directory: Directory holding the cache files (created on first set).
+        ttl: Seconds an entry stays valid after it was written.
+    """
+
+    def __init__(self, directory: Path | str, ttl: float):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{_UNSAFE_KEY_RE.sub('_', key)}.json"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return default
+            return jsonio.loads(path.read_bytes())
+        except FileNotFoundError:
+            return default
+        except ValueError:
+            # Torn write from an interrupted run — treat as a miss
+            path.unlink(missing_ok=True)
+            return default
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, replacing any previous entry atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with open(fd, "wb") as f:
+                f.write(jsonio.dumps(value))
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def delete(self, key: str) -> None:
+        """Drop the entry for key, if any."""
+        self._path(key).unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """Remove all expired entries. Returns the number removed."""
+        if not self.directory.exists():
+            return 0
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
@@ -3,20 +3,56 @@
 Provides thread-safe read/write/append operations on JSON array files.
 Each file stores a list of dicts, with dedup based on a configurable key field.
 
-Supports concurrent writers via patch_items() which re-reads the file before
-each write, merging only the specified fields. This prevents the "lost update"
-problem when multiple pipelines update different fields on the same records.
+Supports concurrent writers via patch_items(), which records only the
+specified fields for each item. This prevents the "lost update" problem when
+multiple pipelines update different fields on the same records.
+
+New items and field patches are appended to a JSONL journal next to the main
+file (saved_posts.json -> saved_posts.jsonl) instead of rewriting the whole
+array. Each journal line is upserted by key on read() — new keys are added,
+existing items get the line's fields merged in. Any full write (or compact())
+folds the journal into the main file, so it stays small relative to the
+snapshot.
+
+Each store instance keeps the last parsed contents in memory, keyed by the
+size/mtime/inode of both files. A long-running pipeline holding one store
+(e.g. run_extraction patching every few posts) therefore parses the file once
+instead of on every save; a change by another process shows up as a new
+stat signature and triggers a re-read.
 """
 
 from __future__ import annotations
 
 import fcntl
-import json
+import os
 import re
-import shutil
 import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
+
+from socmed.utils import jsonio
+
+
+# In-process locks per store path. flock serializes processes; these also
+# serialize threads (e.g. a background flush) without relying on flock
+# semantics for multiple descriptors in one process.
+_thread_locks: dict[Path, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+# Below this size iter_items() just parses the whole file; ijson's per-item
+# overhead only pays off when it avoids holding a large document in memory
+_STREAM_MIN_SIZE = 1024 * 1024
+
+
+def _thread_lock(path: Path) -> threading.Lock:
+    with _thread_locks_guard:
+        lock = _thread_locks.get(path)
+        if lock is None:
+            lock = _thread_locks[path] = threading.Lock()
+        return lock
 
 
 def _sanitize_surrogates(obj):
@@ -35,6 +71,39 @@ def _sanitize_surrogates(obj):
     return obj
 
 
+def _encode(obj, indent: bool = False) -> tuple[bytes, object]:
+    """Serialize obj, sanitizing surrogates only if encoding fails.
+
+    Returns the encoded bytes and the object that was actually encoded
+    (obj itself, or its sanitized copy).
+    """
+    try:
+        return jsonio.dumps(obj, indent=indent), obj
+    except (TypeError, UnicodeEncodeError):
+        # orjson raises JSONEncodeError (a TypeError) on lone surrogates,
+        # stdlib json fails when encoding to UTF-8 — the rare slow path
+        obj = _sanitize_surrogates(obj)
+        return jsonio.dumps(obj, indent=indent), obj
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry change (rename/create) to disk."""
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    # Atomic replace gives a new inode even within the same mtime tick
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 class JsonStore:
     """Manages a JSON array file with atomic writes and deduplication.
 
@@ -46,44 +115,283 @@ class JsonStore:
     def __init__(self, path: Path | str, key_field: str = "id"):
         self.path = Path(path)
         self.key_field = key_field
+        self.journal_path = self.path.with_suffix(".jsonl")
+        self._cache: list[dict] | None = None
+        self._cache_sig: tuple | None = None
+        self._lock_fd: int | None = None
 
-    def read(self) -> list[dict]:
-        """Read all items from the store."""
-        if not self.path.exists():
-            return []
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        """Close the lock file descriptor, if open (the store stays usable)."""
+        fd, self._lock_fd = getattr(self, "_lock_fd", None), None
+        if fd is not None:
+            os.close(fd)
+
+    def signature(self) -> tuple:
+        """Stat signature of the store files; changes whenever either does."""
+        return (_stat_signature(self.path), _stat_signature(self.journal_path))
+
+    def _items(self) -> list[dict]:
+        """Return the cached items, re-reading only if either file changed.
+
+        The returned list is shared with the cache — callers that mutate it
+        must write it back or call _invalidate().
+        """
+        # Stat before reading: a write racing with the read leaves an older
+        # signature behind, so the next call re-reads rather than trusting it.
+        sig = self.signature()
+        if self._cache is None or sig != self._cache_sig:
+            self._cache = self._read_uncached()
+            self._cache_sig = sig
+        return self._cache
+
+    def _invalidate(self) -> None:
+        self._cache = None
+        self._cache_sig = None
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the store's exclusive lock (shared with other threads and processes).
+
+        The lock file is opened once per instance and kept open, so repeated
+        saves (e.g. patch_items every few posts) only flock/unlock.
+        """
+        with _thread_lock(self.path.resolve()):
+            if self._lock_fd is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._lock_fd = os.open(
+                    self.path.with_suffix(".lock"), os.O_CREAT | os.O_RDWR, 0o644
+                )
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _read_base(self) -> list[dict]:
         try:
-            text = self.path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            text = self.path.read_text(encoding="utf-8", errors="replace")
-        if not text.strip():
+            data = self.path.read_bytes()
+        except FileNotFoundError:
             return []
-        return json.loads(text)
+        if not data.strip():
+            return []
+        try:
+            return jsonio.loads(data)
+        except ValueError:
+            # Invalid UTF-8 from web-scraped data
+            return jsonio.loads(data.decode("utf-8", errors="replace"))
+
+    def _replay_journal(self, items: list[dict], journal: bytes) -> list[dict]:
+        """Apply journal lines on top of items (upsert by key_field)."""
+        key_to_idx = {item.get(self.key_field): i for i, item in enumerate(items)}
+        for line in journal.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = jsonio.loads(line)
+            except ValueError:
+                # Torn line from an interrupted write — skip it
+                continue
+            key = entry.get(self.key_field)
+            idx = key_to_idx.get(key) if key is not None else None
+            if idx is None:
+                if key is not None:
+                    key_to_idx[key] = len(items)
+                items.append(entry)
+            else:
+                items[idx].update(entry)
+        return items
+
+    def _read_uncached(self) -> list[dict]:
+        # Read the journal before the snapshot: a concurrent compaction then
+        # either hasn't happened yet or is already reflected in the snapshot,
+        # and replaying a folded-in line is a no-op upsert.
+        try:
+            journal = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            journal = b""
+        items = self._read_base()
+        if journal:
+            items = self._replay_journal(items, journal)
+        return items
+
+    def read(self) -> list[dict]:
+        """Read all items from the store, including journaled appends.
+
+        Served from memory while neither file has changed on disk. Items are
+        shallow copies: reassigning fields is safe, but nested lists and dicts
+        are shared with the cache and must not be modified in place.
+        """
+        return [dict(item) for item in self._items()]
+
+    def iter_items(self) -> Iterator[dict]:
+        """Yield items one at a time, in read() order.
+
+        For large files with ijson installed the main file is streamed, so
+        peak memory is proportional to the items the caller keeps rather
+        than the whole store. Journal lines are applied on the fly. Small
+        files, a fresh in-memory cache, or no ijson fall back to read().
+        """
+        if self._cache is not None and self._cache_sig == self.signature():
+            yield from self.read()
+            return
+        try:
+            import ijson
+        except ImportError:
+            yield from self.read()
+            return
+        try:
+            if self.path.stat().st_size < _STREAM_MIN_SIZE:
+                yield from self.read()
+                return
+        except FileNotFoundError:
+            yield from self.read()
+            return
+
+        # Same read order as _read_uncached(): journal first, then snapshot
+        try:
+            journal = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            journal = b""
+        pending = self._replay_journal([], journal)
+        pending_by_key = {
+            key: entry for entry in pending if (key := entry.get(self.key_field)) is not None
+        }
+
+        yielded = 0
+        try:
+            with open(self.path, "rb") as f:
+                for item in ijson.items(f, "item", use_float=True):
+                    key = item.get(self.key_field)
+                    entry = pending_by_key.pop(key, None) if key is not None else None
+                    if entry is not None:
+                        item.update(entry)
+                    yield item
+                    yielded += 1
+        except FileNotFoundError:
+            pass
+        except (ijson.JSONError, ValueError):
+            # Malformed base file — continue from read(), which recovers
+            yield from self.read()[yielded:]
+            return
+
+        # Journaled items not in the snapshot, in journal order
+        for entry in pending:
+            key = entry.get(self.key_field)
+            if key is None or pending_by_key.pop(key, None) is not None:
+                yield entry
+
+    def read_ids(self) -> set:
+        """Return the set of key_field values without materializing items.
+
+        With ijson installed the main file is streamed and only the key
+        field is decoded; journal lines are small and parsed directly.
+        Falls back to a full read() otherwise.
+        """
+        if self._cache is not None and self._cache_sig == self.signature():
+            return {key for item in self._cache if (key := item.get(self.key_field)) is not None}
+        try:
+            import ijson
+        except ImportError:
+            return {key for item in self._items() if (key := item.get(self.key_field)) is not None}
+
+        try:
+            journal = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            journal = b""
+        try:
+            with open(self.path, "rb") as f:
+                ids = set(ijson.items(f, f"item.{self.key_field}"))
+        except FileNotFoundError:
+            ids = set()
+        except (ijson.JSONError, ValueError):
+            # Malformed base file — let read() apply its recovery
+            return {key for item in self._items() if (key := item.get(self.key_field)) is not None}
+
+        for line in journal.splitlines():
+            if not line.strip():
+                continue
+            try:
+                key = jsonio.loads(line).get(self.key_field)
+            except ValueError:
+                continue
+            if key is not None:
+                ids.add(key)
+        return ids
 
     def write(self, items: list[dict]) -> None:
-        """Atomically overwrite the store with new items."""
+        """Atomically and durably overwrite the store with new items."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        # Sanitize surrogates from web-scraped data
-        items = _sanitize_surrogates(items)
+        data, encoded = _encode(items, indent=True)
         # Write to temp file then rename for atomicity
         fd, tmp_path = tempfile.mkstemp(
             dir=self.path.parent, suffix=".tmp", prefix=".json_store_"
         )
         try:
-            with open(fd, "w", encoding="utf-8") as f:
-                json.dump(items, f, indent=2, ensure_ascii=False)
-                f.write("\n")
-            shutil.move(tmp_path, self.path)
+            with open(fd, "wb") as f:
+                f.write(data)
+                f.write(b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            # Persist the rename before dropping the journal, so a crash can
+            # never leave the old snapshot without the journal (a leftover
+            # journal is harmless: replaying it is an idempotent upsert)
+            _fsync_dir(self.path.parent)
         except Exception:
             Path(tmp_path).unlink(missing_ok=True)
+            self._invalidate()
             raise
+        # The snapshot now holds everything the journal did
+        self.journal_path.unlink(missing_ok=True)
+        # Keep what is now on disk; copy the items unless they already are
+        # the cache (patch_items) so later changes to the caller's list
+        # can't leak in.
+        self._cache = encoded if encoded is self._cache else [dict(i) for i in encoded]
+        self._cache_sig = self.signature()
+
+    def flush(self) -> None:
+        """Flush the store files to disk.
+
+        For writes made with fsync=False: one call at the end of a run makes
+        all of them durable.
+        """
+        with self._locked():
+            for path in (self.path, self.journal_path):
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except FileNotFoundError:
+                    continue
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            if self.path.parent.exists():
+                _fsync_dir(self.path.parent)
+
+    def compact(self) -> bool:
+        """Fold the append journal into the main file.
+
+        Returns True if there was a journal to fold in.
+        """
+        if not self.journal_path.exists():
+            return False
+        with self._locked():
+            if not self.journal_path.exists():
+                return False
+            self.write(self._items())
+            return True
 
     def patch_items(self, patches: dict[str, dict]) -> int:
         """Atomically apply field-level updates to specific items.
 
-        Re-reads the file, applies only the specified field updates, and writes
-        back. Safe for concurrent use by multiple pipelines that update
+        Appends one journal line per patched item holding just the updated
+        fields, so the cost is proportional to the patch rather than the store
+        size. Safe for concurrent use by multiple pipelines that update
         non-overlapping fields (e.g., enricher updates 'source'/'text'/'media',
-        extractor updates 'extracted_text').
+        extractor updates 'extracted_text'). Keys not in the store are ignored.
 
         Args:
             patches: Dict mapping key_field values to dicts of {field: value}
@@ -95,39 +403,69 @@ class JsonStore:
         if not patches:
             return 0
 
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        lock_path = self.path.with_suffix(".lock")
+        with self._locked():
+            # A line for an unknown key would add a stub item on replay
+            existing = self.read_ids()
+            lines = [
+                _encode({**updates, self.key_field: key_value})[0]
+                for key_value, updates in patches.items()
+                if key_value in existing
+            ]
+            if lines:
+                self._write_journal(lines)
+            return len(lines)
 
-        with open(lock_path, "w") as lock_file:
-            fcntl.flock(lock_file, fcntl.LOCK_EX)
-            try:
-                posts = self.read()
-                key_to_idx = {p.get(self.key_field): i for i, p in enumerate(posts)}
-
-                patched = 0
-                for key_value, updates in patches.items():
-                    idx = key_to_idx.get(key_value)
-                    if idx is not None:
-                        posts[idx].update(updates)
-                        patched += 1
-
-                self.write(posts)
-                return patched
-            finally:
-                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    def upsert(self, items: list[dict], fsync: bool = True) -> int:
+        """Add or replace whole items by key_field via the append journal.
+
+        Unlike append(), existing keys are not skipped: each item's fields
+        overwrite the stored ones on replay. Costs one journal line per item
+        instead of a rewrite of the whole file.
+
+        Args:
+            items: Items to write.
+            fsync: Flush the journal to disk before returning. Callers that
+                   save often and can afford to lose the last few saves on
+                   a crash pass False and call flush() once at the end.
+
+        Returns:
+            Number of items written.
+        """
+        if not items:
+            return 0
+        with self._locked():
+            self._write_journal([_encode(item)[0] for item in items], fsync=fsync)
+            return len(items)
 
     def append(self, new_items: list[dict], merge_fn: Optional[Callable] = None) -> int:
         """Append items with deduplication based on key_field.
 
+        Without merge_fn, new items are written to the JSONL journal, so the
+        cost is proportional to the items added rather than the store size.
+        The journal is folded into the main file once it outgrows it.
+
         Args:
             new_items: Items to add.
             merge_fn: Optional function(existing, new) -> merged that merges
-                      duplicates instead of skipping them.
+                      duplicates instead of skipping them. Forces a full
+                      rewrite since existing items change.
 
         Returns:
             Number of new items actually added.
         """
-        existing = self.read()
+        if merge_fn is None:
+            return self._append_journal(new_items)
+
+        with self._locked():
+            try:
+                return self._append_merge(new_items, merge_fn)
+            except BaseException:
+                # merge_fn may have modified cached items before failing
+                self._invalidate()
+                raise
+
+    def _append_merge(self, new_items: list[dict], merge_fn: Callable) -> int:
+        existing = self._items()
         existing_keys = {}
         for i, item in enumerate(existing):
             key = item.get(self.key_field)
@@ -150,22 +488,63 @@ class JsonStore:
         self.write(existing)
         return added
 
+    def _append_journal(self, new_items: list[dict]) -> int:
+        with self._locked():
+            seen = self.read_ids()
+            lines = []
+            for item in new_items:
+                key = item.get(self.key_field)
+                if key and key in seen:
+                    continue
+                if key:
+                    seen.add(key)
+                lines.append(_encode(item)[0])
+            if lines:
+                self._write_journal(lines)
+            return len(lines)
+
+    def _write_journal(self, lines: list[bytes], fsync: bool = False) -> None:
+        """Append encoded lines to the journal. Caller must hold the lock."""
+        cache_fresh = self._cache is not None and self._cache_sig == self.signature()
+        payload = b"\n".join(lines) + b"\n"
+        with open(self.journal_path, "ab") as f:
+            # Start on a fresh line if a previous write was interrupted
+            if f.tell() > 0:
+                with open(self.journal_path, "rb") as r:
+                    r.seek(-1, 2)
+                    if r.read(1) != b"\n":
+                        f.write(b"\n")
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        if cache_fresh:
+            # Nothing else touched the files under our lock — apply the
+            # new lines to the cache instead of re-reading everything
+            self._replay_journal(self._cache, payload)
+            self._cache_sig = self.signature()
+
+        # Compact once the journal outgrows the snapshot — amortized O(1)
+        # per line, and keeps the main file a recent, complete snapshot.
+        base_size = self.path.stat().st_size if self.path.exists() else 0
+        if self.journal_path.stat().st_size > base_size:
+            self.write(self._items())
+
     def count(self) -> int:
         """Return the number of items in the store."""
-        return len(self.read())
+        return len(self._items())
 
     def find(self, **kwargs) -> list[dict]:
         """Find items matching all given field=value pairs."""
-        items = self.read()
         results = []
-        for item in items:
+        for item in self._items():
             if all(item.get(k) == v for k, v in kwargs.items()):
-                results.append(item)
+                results.append(dict(item))
         return results
 
     def delete(self, key_value: str) -> bool:
         """Delete an item by its key field value."""
-        items = self.read()
+        items = self._items()
         filtered = [i for i in items if i.get(self.key_field) != key_value]
         if len(filtered) < len(items):
             self.write(filtered)
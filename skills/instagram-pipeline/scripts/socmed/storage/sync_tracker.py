@@ -2,60 +2,151 @@
 
 from __future__ import annotations
 
+import bisect
+from contextlib import contextmanager
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator
 
-from socmed.config import SYNC_STATE_FILE
+from socmed import config
 from socmed.models.sync_state import SyncCursor
 from socmed.storage.json_store import JsonStore
 
+# summary() table row: platform, content type, items, last sync, status
+_ROW_FMT = "{:<16} | {:<8} | {:>5} | {:<20} | {}"
+
 
 class SyncTracker:
     """Manages sync cursors for all platform + content_type combinations.
 
     The sync state file stores an array of SyncCursor dicts, keyed
-    by "platform:content_type".
+    by "platform:content_type". The parsed file is kept in memory and only
+    re-read when the store's stat signature changes (another process saved).
+    Saves append just the changed cursors to the store's journal, which the
+    store folds back into the JSON file as it grows.
     """
 
     def __init__(self, path: Path | str | None = None):
-        self.store = JsonStore(path or SYNC_STATE_FILE, key_field="key")
+        self.store = JsonStore(path or config.SYNC_STATE_FILE, key_field="key")
+        # key -> item, in file order
+        self._index: dict[str, dict] | None = None
+        self._index_sig: tuple | None = None
+        # Index keys in sorted order, for summary()
+        self._sorted_keys: list[str] = []
+        # Keys saved since the last flush
+        self._dirty: set[str] = set()
+        self._batch_depth = 0
+
+    def _read_cached(self) -> dict[str, dict]:
+        if self._batch_depth and self._index is not None:
+            # Unwritten batched saves live only in the index — don't let a
+            # re-read drop them
+            return self._index
+        sig = self.store.signature()
+        if self._index is None or sig != self._index_sig:
+            self._index = {item.get("key"): item for item in self.store.read()}
+            self._index_sig = sig
+            self._sorted_keys = sorted(key for key in self._index if key is not None)
+        return self._index
 
     def get(self, platform: str, content_type: str) -> SyncCursor:
         """Get the sync cursor for a platform+content_type. Creates if missing."""
-        key = f"{platform}:{content_type}"
-        items = self.store.find(key=key)
-        if items:
-            return SyncCursor.from_dict(items[0])
+        item = self._read_cached().get(f"{platform}:{content_type}")
+        if item is not None:
+            return SyncCursor.from_dict(item)
         return SyncCursor(platform=platform, content_type=content_type)
 
-    def save(self, cursor: SyncCursor) -> None:
-        """Save a sync cursor, creating or updating as needed."""
-        items = self.store.read()
-        key = cursor.key
-        found = False
-        for i, item in enumerate(items):
-            if item.get("key") == key:
-                items[i] = {**cursor.to_dict(), "key": key}
-                found = True
-                break
-        if not found:
-            items.append({**cursor.to_dict(), "key": key})
-        self.store.write(items)
+    def get_raw(self, platform: str, content_type: str) -> dict | None:
+        """Return the stored cursor dict, or None if there is none yet.
+
+        Cheaper than get() for read-only checks (e.g. last_sync_at or
+        total_items) since no SyncCursor is built. The dict is a copy.
+        """
+        item = self._read_cached().get(f"{platform}:{content_type}")
+        return dict(item) if item is not None else None
+
+    def save(self, cursor: SyncCursor, durable: bool = False) -> None:
+        """Save a sync cursor, creating or updating as needed.
+
+        Inside batched() the write is deferred to the end of the batch.
+        Saves are not fsynced unless durable=True — cursors are advisory, and
+        losing the last few on a crash only means re-scanning a little. Call
+        flush() once at the end of a run instead.
+        """
+        self.save_many([cursor], durable=durable)
+
+    def save_many(self, cursors: Iterable[SyncCursor], durable: bool = False) -> None:
+        """Save several cursors with a single append to the state journal.
+
+        Cursors identical to the stored ones are skipped.
+        """
+        index = self._read_cached()
+        for cursor in cursors:
+            item = cursor.to_dict()
+            existing = index.get(item["key"])
+            if existing == item:
+                # e.g. an idle poll re-saving the same cursor — nothing to write
+                continue
+            if existing is None:
+                bisect.insort(self._sorted_keys, item["key"])
+            index[item["key"]] = item
+            self._dirty.add(item["key"])
+        if not self._batch_depth:
+            self._flush(fsync=durable)
+
+    def _flush(self, fsync: bool = False) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.store.upsert([self._index[key] for key in self._dirty], fsync=fsync)
+        except BaseException:
+            self._index = None
+            raise
+        finally:
+            self._dirty.clear()
+        self._index_sig = self.store.signature()
+
+    def flush(self) -> None:
+        """Write any pending batched saves and fsync the state file."""
+        if self._dirty and self._index is not None:
+            self._flush()
+        self.store.flush()
+
+    @contextmanager
+    def batched(self) -> Iterator[SyncTracker]:
+        """Coalesce save() calls made inside the block into one write on exit.
+
+        Nested blocks write once, when the outermost one exits (also on
+        error, so cursors saved before the failure are kept).
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush()
 
     def get_all(self) -> list[SyncCursor]:
         """Get all sync cursors."""
-        return [SyncCursor.from_dict(item) for item in self.store.read()]
+        return [SyncCursor.from_dict(item) for item in self._read_cached().values()]
 
     def summary(self) -> str:
         """Return a human-readable sync status summary."""
-        cursors = self.get_all()
-        if not cursors:
+        index = self._read_cached()
+        if not index:
             return "No sync history found."
 
-        lines = ["Platform         | Content  | Items | Last Sync            | Status"]
-        lines.append("-" * 75)
-        for c in sorted(cursors, key=lambda x: x.key):
-            last_sync = c.last_sync_at[:19] if c.last_sync_at else "never"
-            lines.append(
-                f"{c.platform:<16} | {c.content_type:<8} | {c.total_items:>5} | {last_sync:<20} | {c.last_sync_status}"
+        header = _ROW_FMT.format("Platform", "Content", "Items", "Last Sync", "Status")
+        # Format straight from the stored dicts; no SyncCursor needed
+        rows = (
+            _ROW_FMT.format(
+                c.get("platform", ""),
+                c.get("content_type", ""),
+                c.get("total_items", 0),
+                (c.get("last_sync_at") or "never")[:19],
+                c.get("last_sync_status", ""),
             )
-        return "\n".join(lines)
+            for c in (index[key] for key in self._sorted_keys)
+        )
+        return "\n".join(chain((header, "-" * 75), rows))
@@ -1,5 +1,6 @@
 """Utility modules."""
 
+from socmed.utils.ratelimit import RateLimiter
 from socmed.utils.retry import retry
 
-__all__ = ["retry"]
+__all__ = ["RateLimiter", "retry"]
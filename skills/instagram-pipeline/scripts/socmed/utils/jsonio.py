@@ -0,0 +1,37 @@
+"""JSON encode/decode using orjson when available, stdlib json otherwise.
+
+orjson parses and serializes several times faster than the stdlib module
+and works on bytes directly. It ships with the 'speedups' extra; without it
+the same calls fall back to json with matching output (UTF-8, non-ASCII
+left unescaped, optional 2-space indentation).
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes | str):
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: JSON-compatible object (str keys, no lone surrogates).
+        indent: Pretty-print with 2-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,74 @@
+"""Token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket that paces calls to an average rate.
+
+    Unlike sleeping a fixed delay after each request, time spent inside the
+    request counts towards the interval, so the effective rate matches the
+    configured one instead of 1 / (delay + latency).
+
+    The rate adapts AIMD-style: decrease() cuts it multiplicatively when the
+    server pushes back (HTTP 429), increase() recovers it additively on
+    success. It never exceeds the initial rate, which acts as the ceiling.
+
+    Args:
+        rate: Average acquisitions per second (also the ceiling).
+        burst: Tokens that can accumulate while idle (1 = strict spacing).
+        min_rate: Floor for decrease() (default: rate / 10).
+    """
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available.
+
+        Waiting callers reserve their slot up front, so concurrent threads
+        are released in arrival order at the configured spacing.
+
+        Returns:
+            Seconds slept.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def decrease(self, factor: float = 0.7) -> float:
+        """Multiplicatively lower the rate (on 429). Returns the new rate."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate * factor)
+            return self.rate
+
+    def increase(self, step: float | None = None) -> float:
+        """Additively raise the rate back towards the ceiling (on success).
+
+        The default step recovers the full range in about 50 successes.
+        Returns the new rate.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + (step if step is not None else self.max_rate / 50))
+            return self.rate
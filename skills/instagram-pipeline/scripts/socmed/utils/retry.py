@@ -3,77 +3,159 @@
 from __future__ import annotations
 
 import functools
+import inspect
+import random
 import time
 import logging
-from typing import Callable, Type
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Literal, Type
+
+if TYPE_CHECKING:
+    import asyncio
+    import threading
 
 logger = logging.getLogger(__name__)
 
 
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait according to a Retry-After header value, if valid.
+
+    Accepts both forms the header allows: delay-seconds and an HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_delay(exc: BaseException) -> float | None:
+    """extract_delay hook for retry(): the Retry-After of an HTTP error.
+
+    Works with any exception carrying a requests-style `response`
+    (requests.HTTPError, instagrapi's ClientError).
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get("Retry-After"))
+
+
 def retry(
     max_attempts: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     exceptions: tuple[Type[Exception], ...] = (Exception,),
     on_retry: Callable | None = None,
+    jitter: Literal["full", "decorrelated", "none"] = "full",
+    extract_delay: Callable[[BaseException], float | None] | None = None,
+    cancel_event: threading.Event | asyncio.Event | None = None,
 ):
     """Decorator that retries a function with exponential backoff.
 
+    With max_attempts <= 1 there is nothing to retry, and the function is
+    returned undecorated (no wrapper frame per call).
+
     Args:
         max_attempts: Maximum number of attempts (including the first).
         base_delay: Initial delay in seconds between retries.
         max_delay: Maximum delay cap in seconds.
         exceptions: Tuple of exception types to catch and retry on.
         on_retry: Optional callback(attempt, exception, delay) called before each retry.
+        jitter: Randomize delays so concurrent callers don't retry in lockstep.
+            "full" waits uniform(0, backoff); "decorrelated" waits
+            uniform(base_delay, 3 * previous delay), capped at max_delay;
+            "none" waits the exponential backoff exactly.
+        extract_delay: Optional callback(exception) returning the delay the
+            server asked for (e.g. retry_after_delay), or None. A returned
+            value replaces the computed backoff, capped at max_delay.
+        cancel_event: Optional event that ends a backoff wait early, e.g. on
+            shutdown; the last exception is then raised without retrying.
+            A threading.Event for sync functions, an asyncio.Event for
+            coroutine functions.
     """
+    if jitter not in ("full", "decorrelated", "none"):
+        raise ValueError(f"Unknown jitter mode: {jitter!r}")
 
     def decorator(func):
+        if max_attempts <= 1:
+            return func
+
+        name = func.__name__
+        # Backoff before retry n (1-based) is delays[n - 1]
+        delays = tuple(min(base_delay * (1 << i), max_delay) for i in range(max_attempts - 1))
+
+        def next_delay(attempt: int, prev_delay: float, exc: BaseException) -> float:
+            if extract_delay is not None:
+                requested = extract_delay(exc)
+                if requested is not None:
+                    return min(max(requested, 0.0), max_delay)
+            if jitter == "full":
+                return random.uniform(0, delays[attempt - 1])
+            if jitter == "decorrelated":
+                return min(max_delay, random.uniform(base_delay, prev_delay * 3))
+            return delays[attempt - 1]
+
+        def notify(attempt: int, exc: BaseException, delay: float) -> None:
+            if on_retry:
+                on_retry(attempt, exc, delay)
+            else:
+                logger.warning(
+                    "Retry %d/%d for %s: %s. Waiting %.1fs",
+                    attempt, max_attempts, name, exc, delay,
+                )
+
+        # Each wrapper retries the first max_attempts - 1 calls; the last one
+        # runs outside the loop, so its exception propagates as is. A
+        # cancelled wait re-raises the exception that led to it.
+
+        # inspect (not asyncio) so decorating sync functions doesn't pull in asyncio
+        if inspect.iscoroutinefunction(func):
+            import asyncio
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                delay = base_delay
+                for attempt in range(1, max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        delay = next_delay(attempt, delay, e)
+                        notify(attempt, e, delay)
+                        if cancel_event is None:
+                            await asyncio.sleep(delay)
+                            continue
+                        try:
+                            await asyncio.wait_for(cancel_event.wait(), timeout=delay)
+                        except asyncio.TimeoutError:
+                            continue
+                        raise
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(1, max_attempts + 1):
+            delay = base_delay
+            for attempt in range(1, max_attempts):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt == max_attempts:
-                        break
-                    delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
-                    if on_retry:
-                        on_retry(attempt, e, delay)
-                    else:
-                        logger.warning(
-                            f"Retry {attempt}/{max_attempts} for {func.__name__}: {e}. "
-                            f"Waiting {delay:.1f}s"
-                        )
-                    time.sleep(delay)
-            raise last_exception
+                    delay = next_delay(attempt, delay, e)
+                    notify(attempt, e, delay)
+                    if cancel_event is None:
+                        time.sleep(delay)
+                    elif cancel_event.wait(delay):
+                        raise
+            return func(*args, **kwargs)
 
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            import asyncio
-            last_exception = None
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt == max_attempts:
-                        break
-                    delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
-                    if on_retry:
-                        on_retry(attempt, e, delay)
-                    else:
-                        logger.warning(
-                            f"Retry {attempt}/{max_attempts} for {func.__name__}: {e}. "
-                            f"Waiting {delay:.1f}s"
-                        )
-                    await asyncio.sleep(delay)
-            raise last_exception
-
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return wrapper
 
     return decorator
@@ -0,0 +1,20 @@
+"""Timestamp formatting helpers."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+_ISO_UTC_FMT = "%Y-%m-%dT%H:%M:%S+00:00"
+
+
+def utc_iso(ts: float) -> str:
+    """Format a Unix timestamp as an ISO 8601 UTC string.
+
+    Same output as datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(),
+    but whole-second timestamps (what Instagram returns) go through
+    time.strftime, which skips building datetime objects.
+    """
+    if ts != int(ts):
+        return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+    return time.strftime(_ISO_UTC_FMT, time.gmtime(ts))
@@ -0,0 +1,102 @@
+"""Tests for saved-feed pagination and sync cursor gating."""
+
+from __future__ import annotations
+
+import pytest
+
+from socmed import config
+from socmed.platforms.instagram import api_bootstrap
+from socmed.storage.sync_tracker import SyncTracker
+
+
+def _item(pk: int) -> dict:
+    return {"media": {"pk": pk, "code": f"C{pk}", "media_type": 1, "saved_collection_ids": ["1"]}}
+
+
+def _feed(monkeypatch, pages: list[list[int]], fail_at: int | None = None) -> list[dict]:
+    """Serve pages of item pks from _fetch_page; page fail_at answers like a 429."""
+    requests = []
+
+    def fake_fetch_page(session, url, params, delay, stop, headers=None):
+        requests.append(params)
+        page = int(params.get("max_id", 0))
+        if page == fail_at:
+            return None
+        more = page + 1 < len(pages)
+        return [_item(pk) for pk in pages[page]], {"more_available": more, "next_max_id": str(page + 1)}
+
+    monkeypatch.setattr(api_bootstrap, "_fetch_page", fake_fetch_page)
+    return requests
+
+
+def _fetch(**kwargs) -> tuple[list[dict], dict]:
+    meta: dict = {}
+    posts = api_bootstrap.fetch_saved_posts(None, {"1": "Food"}, delay=0, meta=meta, **kwargs)
+    return posts, meta
+
+
+def test_fetch_complete_at_end_of_feed(monkeypatch):
+    _feed(monkeypatch, [[5, 4], [3]])
+    posts, meta = _fetch()
+    assert [p["id"] for p in posts] == ["C5", "C4", "C3"]
+    assert meta["complete"] is True
+    assert meta["head"]["media_pk"] == "5"
+
+
+def test_fetch_incomplete_when_a_page_fails(monkeypatch):
+    _feed(monkeypatch, [[5, 4], [3]], fail_at=1)
+    posts, meta = _fetch()
+    assert [p["id"] for p in posts] == ["C5", "C4"]
+    assert meta["complete"] is False
+
+
+def test_fetch_stops_at_last_synced_post(monkeypatch):
+    requests = _feed(monkeypatch, [[5, 4], [3, 2], [1]])
+    posts, meta = _fetch(stop_at_pk="3")
+    assert [p["id"] for p in posts] == ["C5", "C4"]
+    assert meta["complete"] is True
+    # The page after the one holding the cursor may be prefetched, not more
+    assert len(requests) <= 3
+
+
+@pytest.fixture
+def sync_env(monkeypatch, tmp_path):
+    """Point run_sync at temporary files and a fake session."""
+    monkeypatch.setattr(config, "DATA_FILES", {"instagram": {"saved_posts": tmp_path / "saved_posts.json"}})
+    monkeypatch.setattr(config, "SYNC_STATE_FILE", tmp_path / "sync_state.json")
+    monkeypatch.setattr(api_bootstrap, "get_chrome_cookies", lambda: {})
+    monkeypatch.setattr(api_bootstrap, "build_session", lambda cookies: None)
+    monkeypatch.setattr(
+        api_bootstrap, "_load_collections_cached", lambda session: [{"id": "1", "name": "Food", "count": 3}]
+    )
+    return tmp_path
+
+
+def _cursor():
+    return SyncTracker().get("instagram", "saved")
+
+
+def test_complete_sync_advances_cursor(sync_env, monkeypatch):
+    _feed(monkeypatch, [[5, 4], [3]])
+    api_bootstrap.run_sync(delay=0, download_media=False)
+    cursor = _cursor()
+    assert (cursor.last_id, cursor.last_sync_status, cursor.total_items) == ("5", "success", 3)
+
+
+def test_failed_page_keeps_cursor(sync_env, monkeypatch):
+    _feed(monkeypatch, [[5, 4], [3]])
+    api_bootstrap.run_sync(delay=0, download_media=False)
+
+    # New posts on top, but the feed fails before reaching the old head
+    _feed(monkeypatch, [[7, 6], [5, 4], [3]], fail_at=1)
+    api_bootstrap.run_sync(delay=0, download_media=False)
+    cursor = _cursor()
+    assert cursor.last_id == "5"
+    assert cursor.last_sync_status == "partial"
+    assert cursor.total_items == 5
+
+
+def test_limited_sync_does_not_move_cursor(sync_env, monkeypatch):
+    _feed(monkeypatch, [[5, 4], [3]])
+    api_bootstrap.run_sync(limit=2, delay=0, download_media=False)
+    assert _cursor().last_id == ""
@@ -0,0 +1,56 @@
+"""Tests for the on-disk TTL cache."""
+
+from __future__ import annotations
+
+import os
+import time
+
+from socmed.storage.file_cache import FileCache
+
+
+def _age(cache: FileCache, key: str, seconds: float) -> None:
+    past = time.time() - seconds
+    os.utime(cache._path(key), (past, past))
+
+
+def test_set_get_round_trip(tmp_path):
+    cache = FileCache(tmp_path / "cache", ttl=60)
+    cache.set("post:ABC", {"media": [1, 2]})
+    assert cache.get("post:ABC") == {"media": [1, 2]}
+    assert cache.get("missing", "default") == "default"
+
+
+def test_expired_entry_is_a_miss_and_removed(tmp_path):
+    cache = FileCache(tmp_path, ttl=60)
+    cache.set("k", 1)
+    _age(cache, "k", 120)
+    assert cache.get("k") is None
+    assert not cache._path("k").exists()
+
+
+def test_torn_entry_is_a_miss(tmp_path):
+    cache = FileCache(tmp_path, ttl=60)
+    cache.set("k", {"a": 1})
+    cache._path("k").write_bytes(b'{"a": ')
+    assert cache.get("k") is None
+
+
+def test_unsafe_keys_stay_in_directory(tmp_path):
+    cache = FileCache(tmp_path, ttl=60)
+    cache.set("../escape/key", 1)
+    assert cache._path("../escape/key").parent == tmp_path
+    assert cache.get("../escape/key") == 1
+
+
+def test_delete_and_prune(tmp_path):
+    cache = FileCache(tmp_path, ttl=60)
+    for key in ("fresh", "old1", "old2", "gone"):
+        cache.set(key, key)
+    cache.delete("gone")
+    _age(cache, "old1", 120)
+    _age(cache, "old2", 120)
+
+    assert cache.prune() == 2
+    assert cache.get("fresh") == "fresh"
+    assert cache.get("gone") is None
+    assert FileCache(tmp_path / "never-created", ttl=60).prune() == 0
@@ -0,0 +1,129 @@
+"""Tests for JsonStore's append journal, compaction and streaming reads."""
+
+from __future__ import annotations
+
+import pytest
+
+from socmed.storage import json_store
+from socmed.storage.json_store import JsonStore
+
+
+def _posts(n: int, text: str = "") -> list[dict]:
+    return [{"id": f"p{i}", "text": text, "collections": ["Food"]} for i in range(n)]
+
+
+@pytest.fixture
+def store(tmp_path) -> JsonStore:
+    return JsonStore(tmp_path / "saved_posts.json")
+
+
+def test_append_goes_to_journal(store):
+    store.write(_posts(20, "x" * 100))
+    assert store.append([{"id": "new"}]) == 1
+    assert store.journal_path.exists()
+    assert [p["id"] for p in store.read()][-1] == "new"
+
+
+def test_append_skips_existing_keys(store):
+    store.write(_posts(3))
+    assert store.append([{"id": "p1", "text": "changed"}, {"id": "p9"}]) == 1
+    assert store.find(id="p1")[0]["text"] == ""
+
+
+def test_replay_skips_torn_final_line(store):
+    store.write(_posts(20, "x" * 100))
+    store.append([{"id": "a"}])
+    # Interrupted write: half a line, no trailing newline
+    with open(store.journal_path, "ab") as f:
+        f.write(b'{"id": "torn", "te')
+
+    fresh = JsonStore(store.path)
+    assert "torn" not in fresh.read_ids()
+    assert [p["id"] for p in fresh.read()][-1] == "a"
+
+    # The next append starts on a new line instead of extending the torn one
+    fresh.append([{"id": "b"}])
+    assert [p["id"] for p in JsonStore(store.path).read()][-2:] == ["a", "b"]
+
+
+def test_patch_items_merges_fields_and_ignores_unknown_keys(store):
+    store.write(_posts(20, "x" * 100))
+    assert store.patch_items({"p3": {"extracted_text": {"ocr_texts": ["hi"]}}, "nope": {"a": 1}}) == 1
+
+    item = JsonStore(store.path).find(id="p3")[0]
+    assert item["extracted_text"] == {"ocr_texts": ["hi"]}
+    assert item["text"] == "x" * 100
+    assert "nope" not in JsonStore(store.path).read_ids()
+
+
+def test_upsert_replaces_existing_items(store):
+    store.write(_posts(20, "x" * 100))
+    store.upsert([{"id": "p0", "text": "new"}, {"id": "extra"}])
+
+    items = {p["id"]: p for p in JsonStore(store.path).read()}
+    assert items["p0"]["text"] == "new"
+    assert "extra" in items
+
+
+def test_journal_compacts_once_larger_than_snapshot(store):
+    store.write(_posts(5, "x" * 50))
+    base_size = store.path.stat().st_size
+
+    for added in range(1, 100):
+        store.append([{"id": f"n{added - 1}", "text": "y" * 50}])
+        if not store.journal_path.exists():
+            break
+        # Kept as a journal while it is no larger than the snapshot
+        assert store.journal_path.stat().st_size <= base_size
+    else:
+        pytest.fail("journal never compacted")
+
+    # Folded in: the snapshot alone holds every item
+    assert not store.journal_path.exists()
+    ids = {p["id"] for p in JsonStore(store.path)._read_base()}
+    assert {f"n{i}" for i in range(added)} <= ids
+    assert len(ids) == 5 + added
+
+
+def test_compact_folds_journal(store):
+    store.write(_posts(20, "x" * 100))
+    store.append([{"id": "a"}])
+    before = store.read()
+
+    assert store.compact() is True
+    assert not store.journal_path.exists()
+    assert JsonStore(store.path).read() == before
+    assert store.compact() is False
+
+
+@pytest.mark.parametrize("stream_min_size", [json_store._STREAM_MIN_SIZE, 0])
+def test_iter_items_matches_read(tmp_path, monkeypatch, stream_min_size):
+    # 0 forces the streaming path for a small file
+    monkeypatch.setattr(json_store, "_STREAM_MIN_SIZE", stream_min_size)
+    path = tmp_path / "saved_posts.json"
+    JsonStore(path).write(_posts(50, "x" * 100) + [{"id": "float", "score": 1.5}])
+    writer = JsonStore(path)
+    writer.patch_items({"p2": {"text": "patched"}, "p40": {"extracted_text": {"a": 1}}})
+    writer.append([{"id": "new1"}, {"id": "new2"}])
+
+    # Fresh instances, so neither is served from a warm cache
+    assert list(JsonStore(path).iter_items()) == JsonStore(path).read()
+
+
+def test_read_ids_includes_journal(store):
+    store.write(_posts(20, "x" * 100))
+    store.append([{"id": "j1"}])
+    assert JsonStore(store.path).read_ids() == {f"p{i}" for i in range(20)} | {"j1"}
+
+
+def test_read_returns_copies(store):
+    store.write(_posts(2))
+    store.read()[0]["text"] = "mutated"
+    assert store.read()[0]["text"] == ""
+
+
+def test_cache_picks_up_other_writers(store):
+    store.write(_posts(2))
+    assert store.count() == 2
+    JsonStore(store.path).append([{"id": "other"}])
+    assert store.count() == 3
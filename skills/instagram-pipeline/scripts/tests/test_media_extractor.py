@@ -0,0 +1,72 @@
+"""Tests for media_extractor helpers that run without ffmpeg, OCR or Whisper."""
+
+from __future__ import annotations
+
+from socmed.platforms.instagram.media_extractor import _dhash, _drop_similar_frames, _mlx_whisper_repo, deduplicate_ocr_texts
+
+# 9x8 grayscale thumbnail brightening along every row: all 64 bits set
+RISING = bytes(range(9)) * 8
+
+# Flat 9x8 thumbnail: no bits set
+FLAT = bytes(72)
+
+
+def test_dedup_collapses_case_punctuation_and_whitespace():
+    texts = [("Big sale!", 0.6), ("Other", 0.9), ("big   SALE", 0.8), ("big-sale", 0.7)]
+    # The best original wins, in the order texts were first seen
+    assert deduplicate_ocr_texts(texts) == ["big   SALE", "Other"]
+    assert deduplicate_ocr_texts(texts, sort=True) == ["Other", "big   SALE"]
+
+
+def test_dedup_drops_texts_contained_in_longer_ones():
+    texts = [
+        ("Big sale", 0.9),
+        ("Big sale today only", 0.5),
+        ("today only", 0.9),
+        ("sale big", 0.9),  # same words, other order
+        ("sal", 0.9),  # part of a word only
+    ]
+    assert deduplicate_ocr_texts(texts) == ["Big sale today only", "sale big", "sal"]
+
+
+def test_dedup_skips_empty_texts():
+    assert deduplicate_ocr_texts([("...", 0.9), ("  ", 0.9), ("ok", 0.9)]) == ["ok"]
+
+
+def test_dhash_sets_a_bit_per_brighter_right_neighbour():
+    assert _dhash(RISING) == 2**64 - 1
+    assert _dhash(FLAT) == 0
+    assert _dhash(bytes(reversed(RISING))) == 0
+
+    one_step = bytearray(FLAT)
+    one_step[1] = 10
+    # Only the first pair (top-left) rises: the most significant bit
+    assert _dhash(bytes(one_step)) == 1 << 63
+
+
+def test_drop_similar_frames_compares_with_last_kept(tmp_path):
+    paths = []
+    for name in "abcde":
+        path = tmp_path / f"{name}.jpg"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    nearly_flat = bytearray(FLAT)
+    nearly_flat[1] = 10  # within FRAME_DHASH_MAX_DISTANCE of FLAT
+
+    hashes = RISING + RISING + FLAT + bytes(nearly_flat) + RISING
+    kept = _drop_similar_frames(paths, hashes)
+
+    assert kept == [paths[0], paths[2], paths[4]]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.jpg", "c.jpg", "e.jpg"]
+
+
+def test_drop_similar_frames_keeps_all_without_a_hash_per_frame(tmp_path):
+    paths = [str(tmp_path / "a.jpg"), str(tmp_path / "b.jpg")]
+    assert _drop_similar_frames(paths, RISING) == paths
+
+
+def test_mlx_whisper_repo_names():
+    assert _mlx_whisper_repo("large-v3") == "mlx-community/whisper-large-v3-mlx"
+    assert _mlx_whisper_repo("large-v3-turbo") == "mlx-community/whisper-large-v3-turbo"
+    assert _mlx_whisper_repo("distil-large-v3") == "mlx-community/distil-whisper-large-v3"
+    assert _mlx_whisper_repo("someone/custom-whisper") == "someone/custom-whisper"
@@ -0,0 +1,69 @@
+"""Tests for the token-bucket RateLimiter and its AIMD rate adjustment."""
+
+from __future__ import annotations
+
+import pytest
+
+from socmed.utils import ratelimit
+from socmed.utils.ratelimit import RateLimiter
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", fake)
+    return fake
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+def test_paces_calls_to_rate(clock):
+    limiter = RateLimiter(rate=2.0)
+    waits = [limiter.acquire() for _ in range(3)]
+    assert waits == [0.0, 0.5, 0.5]
+
+
+def test_request_time_counts_towards_interval(clock):
+    limiter = RateLimiter(rate=2.0)
+    limiter.acquire()
+    clock.now += 0.3  # time spent in the request
+    assert limiter.acquire() == pytest.approx(0.2)
+
+
+def test_burst_allows_back_to_back_calls(clock):
+    limiter = RateLimiter(rate=1.0, burst=3)
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire() == pytest.approx(1.0)
+
+
+def test_decrease_is_multiplicative_with_floor(clock):
+    limiter = RateLimiter(rate=1.0)
+    assert limiter.decrease(0.5) == 0.5
+    for _ in range(20):
+        limiter.decrease(0.5)
+    assert limiter.rate == pytest.approx(0.1)  # default floor: rate / 10
+
+
+def test_increase_is_additive_up_to_ceiling(clock):
+    limiter = RateLimiter(rate=1.0)
+    limiter.decrease(0.5)
+    assert limiter.increase() == pytest.approx(0.52)  # max_rate / 50
+    assert limiter.increase(step=10) == 1.0
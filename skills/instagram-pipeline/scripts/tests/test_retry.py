@@ -0,0 +1,165 @@
+"""Tests for the retry decorator and Retry-After handling."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from socmed.utils.retry import parse_retry_after, retry, retry_after_delay
+
+# socmed.utils re-exports retry(), which shadows the submodule attribute
+retry_module = importlib.import_module("socmed.utils.retry")
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Record backoff sleeps instead of waiting."""
+    recorded: list[float] = []
+    monkeypatch.setattr(retry_module, "time", SimpleNamespace(sleep=recorded.append))
+    return recorded
+
+
+def _failing(times: int, exc: Exception = RuntimeError("boom")):
+    calls = {"n": 0}
+
+    def func():
+        calls["n"] += 1
+        if calls["n"] <= times:
+            raise exc
+        return "ok"
+
+    return func, calls
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("120", 120.0), ("1.5", 1.5), ("-5", 0.0), ("", None), (None, None), ("soon", None)],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    future = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 55 <= parse_retry_after(format_datetime(future, usegmt=True)) <= 60
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_retry_after_delay_reads_response_header():
+    exc = RuntimeError()
+    exc.response = SimpleNamespace(headers={"Retry-After": "7"})
+    assert retry_after_delay(exc) == 7.0
+    assert retry_after_delay(RuntimeError()) is None
+
+
+def test_retries_until_success(sleeps):
+    func, calls = _failing(2)
+    assert retry(max_attempts=3, jitter="none")(func)() == "ok"
+    assert calls["n"] == 3
+    assert sleeps == [1.0, 2.0]
+
+
+def test_raises_last_exception_when_exhausted(sleeps):
+    func, calls = _failing(5, ValueError("still failing"))
+    with pytest.raises(ValueError, match="still failing"):
+        retry(max_attempts=3, jitter="none")(func)()
+    assert calls["n"] == 3
+
+
+def test_only_listed_exceptions_are_retried(sleeps):
+    func, calls = _failing(1, KeyError("x"))
+    with pytest.raises(KeyError):
+        retry(exceptions=(ValueError,))(func)()
+    assert calls["n"] == 1 and sleeps == []
+
+
+def test_backoff_capped_at_max_delay(sleeps):
+    func, _ = _failing(4)
+    retry(max_attempts=5, base_delay=1.0, max_delay=3.0, jitter="none")(func)()
+    assert sleeps == [1.0, 2.0, 3.0, 3.0]
+
+
+def test_full_jitter_stays_within_backoff(sleeps):
+    func, _ = _failing(4)
+    retry(max_attempts=5, base_delay=1.0, jitter="full")(func)()
+    assert all(0 <= d <= cap for d, cap in zip(sleeps, [1.0, 2.0, 4.0, 8.0]))
+
+
+def test_unknown_jitter_rejected():
+    with pytest.raises(ValueError):
+        retry(jitter="sometimes")
+
+
+def test_extract_delay_overrides_backoff(sleeps):
+    func, _ = _failing(2)
+    retry(max_attempts=3, max_delay=10.0, extract_delay=lambda e: 30.0)(func)()
+    # Server-requested delays are still capped at max_delay
+    assert sleeps == [10.0, 10.0]
+
+
+def test_on_retry_replaces_logging(sleeps):
+    seen = []
+    func, _ = _failing(1)
+    retry(jitter="none", on_retry=lambda attempt, exc, delay: seen.append((attempt, str(exc), delay)))(func)()
+    assert seen == [(1, "boom", 1.0)]
+
+
+def test_single_attempt_returns_function_unwrapped():
+    def func():
+        return 1
+
+    assert retry(max_attempts=1)(func) is func
+
+
+def test_cancel_event_stops_retrying():
+    event = threading.Event()
+    event.set()
+    func, calls = _failing(5)
+    with pytest.raises(RuntimeError):
+        retry(base_delay=30.0, cancel_event=event)(func)()
+    assert calls["n"] == 1
+
+
+def test_async_retries(monkeypatch):
+    calls = {"n": 0}
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+
+    @retry(max_attempts=3)
+    async def func():
+        calls["n"] += 1
+        if calls["n"] < 3:
+            raise RuntimeError("boom")
+        return "ok"
+
+    assert asyncio.run(func()) == "ok"
+    assert calls["n"] == 3
+
+
+def test_async_cancel_event_stops_retrying():
+    calls = {"n": 0}
+
+    async def main():
+        event = asyncio.Event()
+        event.set()
+
+        @retry(base_delay=30.0, cancel_event=event)
+        async def func():
+            calls["n"] += 1
+            raise RuntimeError("boom")
+
+        await func()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+    assert calls["n"] == 1
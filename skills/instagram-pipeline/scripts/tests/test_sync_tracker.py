@@ -0,0 +1,108 @@
+"""Tests for SyncTracker's cached index, batching and journaled saves."""
+
+from __future__ import annotations
+
+import pytest
+
+from socmed.models.sync_state import SyncCursor
+from socmed.storage.sync_tracker import SyncTracker
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "sync_state.json"
+
+
+def _cursor(platform: str = "instagram", content_type: str = "saved", total: int = 1) -> SyncCursor:
+    cursor = SyncCursor(platform=platform, content_type=content_type)
+    cursor.mark_success(total_items=total, last_id=f"pk{total}")
+    return cursor
+
+
+def test_get_creates_missing_cursor(path):
+    cursor = SyncTracker(path).get("instagram", "saved")
+    assert cursor.key == "instagram:saved"
+    assert cursor.total_items == 0
+
+
+def test_save_round_trips(path):
+    cursor = _cursor(total=5)
+    SyncTracker(path).save(cursor)
+    assert SyncTracker(path).get("instagram", "saved") == cursor
+
+
+def test_saves_append_to_journal(path):
+    tracker = SyncTracker(path)
+    tracker.save(_cursor(total=1))
+    tracker.save(_cursor("instagram", "enrichment", total=2))
+    # Small enough to stay in the journal rather than rewrite the snapshot
+    assert tracker.store.journal_path.exists()
+    assert {c.key for c in SyncTracker(path).get_all()} == {"instagram:saved", "instagram:enrichment"}
+
+
+def test_unchanged_cursor_is_not_rewritten(path):
+    tracker = SyncTracker(path)
+    cursor = _cursor(total=3)
+    tracker.save(cursor)
+    sig = tracker.store.signature()
+    tracker.save(cursor)
+    assert tracker.store.signature() == sig
+
+
+def test_batched_writes_once_on_exit(path):
+    tracker = SyncTracker(path)
+    with tracker.batched():
+        tracker.save(_cursor("a", "x"))
+        with tracker.batched():
+            tracker.save(_cursor("b", "x"))
+        # Nested exit doesn't write; the outermost one does
+        assert not path.exists() and not tracker.store.journal_path.exists()
+        assert tracker.get("b", "x").total_items == 1
+    assert {c.key for c in SyncTracker(path).get_all()} == {"a:x", "b:x"}
+
+
+def test_batched_saves_survive_exception(path):
+    tracker = SyncTracker(path)
+    with pytest.raises(RuntimeError):
+        with tracker.batched():
+            tracker.save(_cursor(total=7))
+            raise RuntimeError("sync failed")
+
+    assert SyncTracker(path).get("instagram", "saved").total_items == 7
+
+
+def test_sees_saves_from_other_instances(path):
+    tracker = SyncTracker(path)
+    assert tracker.get_raw("instagram", "saved") is None
+    SyncTracker(path).save(_cursor(total=4))
+    assert tracker.get_raw("instagram", "saved")["total_items"] == 4
+
+
+def test_get_raw_returns_copy(path):
+    tracker = SyncTracker(path)
+    tracker.save(_cursor(total=2))
+    tracker.get_raw("instagram", "saved")["total_items"] = 99
+    assert tracker.get("instagram", "saved").total_items == 2
+
+
+def test_flush_writes_pending_batch(path):
+    tracker = SyncTracker(path)
+    with tracker.batched():
+        tracker.save(_cursor(total=3))
+        tracker.flush()
+        assert SyncTracker(path).get("instagram", "saved").total_items == 3
+
+
+def test_summary_sorted_by_key(path):
+    tracker = SyncTracker(path)
+    assert tracker.summary() == "No sync history found."
+    tracker.save_many([_cursor("zeta", "x"), _cursor("alpha", "x")])
+    rows = tracker.summary().splitlines()[2:]
+    assert [row.split("|")[0].strip() for row in rows] == ["alpha", "zeta"]
+
+
+def test_cursor_from_dict_tolerates_partial_and_extra_fields():
+    cursor = SyncCursor.from_dict({"platform": "p", "content_type": "c", "key": "p:c", "junk": 1})
+    assert (cursor.platform, cursor.content_type, cursor.total_items) == ("p", "c", 0)
+    full = _cursor(total=9)
+    assert SyncCursor.from_dict(full.to_dict()) == full